@@ -6,8 +6,8 @@ This file demonstrates common usage patterns and best practices.
 """
 
 import os
-import asyncio
 from propellerads.client import PropellerAdsClient
+from propellerads.async_client import run
 from claude_propellerads_integration import ClaudePropellerAdsIntegration
 
 def basic_client_usage():
@@ -159,4 +159,4 @@ async def main():
     print("   - Review the test files in tests/")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -18,7 +18,7 @@ __author__ = "PropellerAds Team"
 __email__ = "support@propellerads.com"
 
 # Import main client classes
-from .client import PropellerAdsClient as LegacyPropellerAdsClient, BalanceResponse
+from .client import PropellerAdsClient as LegacyPropellerAdsClient, BalanceResponse, get_shared_client, close_shared_client
 
 # Try to import enhanced client, fallback to legacy if not available
 try:
@@ -59,6 +59,8 @@ __all__ = [
     'PropellerAdsClient',
     'LegacyPropellerAdsClient',
     'BalanceResponse',
+    'get_shared_client',
+    'close_shared_client',
     
     # Exceptions
     'PropellerAdsError',
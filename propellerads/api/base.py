@@ -3,11 +3,18 @@ Base API class with common functionality
 """
 
 import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Mapping, Tuple, Union
 from urllib.parse import urljoin
 import aiohttp
-from aiohttp import ClientTimeout, ClientSession
+from aiohttp import ClientTimeout, ClientSession, TCPConnector
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..exceptions import (
     PropellerAdsAPIError, 
@@ -19,10 +26,16 @@ from ..exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class BaseAPI:
     """Base API class with common functionality"""
     
+    # Connection pool of the aiohttp session shared by a client's API modules
+    CONNECTOR_LIMIT = 100
+    CONNECTOR_LIMIT_PER_HOST = 50
+    
     def __init__(self, client):
         """Initialize with client reference"""
         self.client = client
@@ -42,11 +55,27 @@ class BaseAPI:
         """Async context manager exit"""
         await self.close()
     
+    @property
+    def session(self) -> Optional[ClientSession]:
+        """HTTP session shared with the other API modules of the client"""
+        return getattr(self.client, 'async_session', None)
+    
+    @session.setter
+    def session(self, value: Optional[ClientSession]):
+        self.client.async_session = value
+    
     async def _ensure_session(self):
         """Ensure HTTP session is created"""
         if self.session is None or self.session.closed:
             timeout = ClientTimeout(total=30, connect=10)
+            connector = TCPConnector(
+                limit=self.CONNECTOR_LIMIT,
+                limit_per_host=self.CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
             self.session = ClientSession(
+                connector=connector,
                 timeout=timeout,
                 headers={
                     'Authorization': f'Bearer {self.api_key}',
@@ -70,9 +99,19 @@ class BaseAPI:
         endpoint: str, 
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        retry_count: int = 3
-    ) -> Dict[str, Any]:
-        """Make HTTP request with error handling and retries"""
+        retry_count: int = 3,
+        raw: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+        with_headers: bool = False
+    ) -> Union[Dict[str, Any], bytes, Tuple[Any, Mapping[str, str]]]:
+        """
+        Make HTTP request with error handling and retries
+        
+        With raw=True the undecoded response body is returned, so callers can
+        validate it straight into schemas without building intermediate dicts.
+        With with_headers=True a (body, response headers) pair is returned;
+        the body is None for a 304 Not Modified reply to a conditional request.
+        """
         
         await self._ensure_session()
         url = self._build_url(endpoint)
@@ -81,38 +120,47 @@ class BaseAPI:
         if params:
             params = {k: v for k, v in params.items() if v is not None}
         
+        # Encode the body once up front; the session already sends a JSON content type
+        if data is not None and ORJSON_AVAILABLE:
+            body = {'data': orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)}
+        else:
+            body = {'json': data}
+        
         for attempt in range(retry_count + 1):
             try:
                 self._request_count += 1
                 
-                logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
+                logger.debug("Making %s request to %s (attempt %d)", method, url, attempt + 1)
                 
                 async with self.session.request(
                     method=method,
                     url=url,
-                    json=data,
-                    params=params
+                    params=params,
+                    headers=headers,
+                    **body
                 ) as response:
                     
                     # Update rate limit info
                     self._update_rate_limit_info(response)
                     
                     # Handle response
-                    response_data = await self._handle_response(response)
+                    response_data = await self._handle_response(response, raw=raw)
                     
-                    logger.debug(f"Request successful: {method} {url}")
+                    logger.debug("Request successful: %s %s", method, url)
+                    if with_headers:
+                        return response_data, response.headers
                     return response_data
                     
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 self._error_count += 1
                 
                 if attempt == retry_count:
-                    logger.error(f"Request failed after {retry_count + 1} attempts: {e}")
+                    logger.error("Request failed after %d attempts: %s", retry_count + 1, e)
                     raise PropellerAdsAPIError(f"Request failed: {e}")
                 
                 # Exponential backoff
                 wait_time = 2 ** attempt
-                logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
+                logger.warning("Request failed, retrying in %ss: %s", wait_time, e)
                 await asyncio.sleep(wait_time)
     
     def _update_rate_limit_info(self, response):
@@ -123,9 +171,13 @@ class BaseAPI:
         if 'X-RateLimit-Reset' in response.headers:
             self._rate_limit_reset = int(response.headers['X-RateLimit-Reset'])
     
-    async def _handle_response(self, response) -> Dict[str, Any]:
+    async def _handle_response(self, response, raw: bool = False) -> Union[Dict[str, Any], bytes]:
         """Handle HTTP response and errors"""
         
+        # Conditional request matched; the caller keeps its cached body
+        if response.status == 304:
+            return None
+        
         # Check for rate limiting
         if response.status == 429:
             raise PropellerAdsRateLimitError(
@@ -161,7 +213,9 @@ class BaseAPI:
         
         # Parse successful response
         try:
-            return await response.json()
+            if raw:
+                return await response.read()
+            return await response.json(loads=_json_loads)
         except Exception as e:
             raise PropellerAdsAPIError(f"Failed to parse response: {e}")
     
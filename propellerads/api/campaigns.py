@@ -2,19 +2,80 @@
 Campaigns API implementation
 """
 
-from typing import List, Optional, Dict, Any
+from typing import Awaitable, Callable, List, Optional, Dict, Any
+import asyncio
 import logging
 
 from .base import BaseAPI
 from ..schemas.campaign import Campaign, CampaignFilters, CampaignResponse
 from ..exceptions import PropellerAdsValidationError
+from ..utils.batching import next_batch
 
 logger = logging.getLogger(__name__)
 
+# Single-campaign start/stop calls arriving within this window share one request
+STATE_BATCH_WINDOW = 0.05
+STATE_BATCH_MAX_SIZE = 100
+
+
+class _CampaignIdBatcher:
+    """Coalesce single campaign IDs into one multi-ID request"""
+    
+    def __init__(self, send: Callable[[List[int]], Awaitable[Dict[str, Any]]]):
+        self._send = send
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def submit(self, campaign_id: int) -> Dict[str, Any]:
+        """Queue a campaign ID and wait for the response of its batch"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((campaign_id, future))
+        return await future
+    
+    async def _run(self):
+        while True:
+            batch = await next_batch(self._queue, STATE_BATCH_WINDOW, STATE_BATCH_MAX_SIZE)
+            
+            campaign_ids = list(dict.fromkeys(campaign_id for campaign_id, _ in batch))
+            try:
+                result = await self._send(campaign_ids)
+            except Exception as e:
+                result = e
+            
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+    
+    def close(self):
+        """Stop the background worker"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
 
 class CampaignAPI(BaseAPI):
     """Campaign management API"""
     
+    def __init__(self, client):
+        """Initialize with client reference"""
+        super().__init__(client)
+        self._start_batcher = _CampaignIdBatcher(self.start_campaigns)
+        self._stop_batcher = _CampaignIdBatcher(self.stop_campaigns)
+    
+    async def close(self):
+        """Stop the start/stop batch workers and close the HTTP session"""
+        self._start_batcher.close()
+        self._stop_batcher.close()
+        await super().close()
+    
     async def create_campaign(self, campaign_data: Campaign) -> Campaign:
         """
         Create a new campaign
@@ -61,6 +122,27 @@ class CampaignAPI(BaseAPI):
         response = await self._get(f'/adv/campaigns/{campaign_id}')
         return Campaign.from_api_response(response)
     
+    async def get_campaigns_batch(self, campaign_ids: List[int], concurrency: int = 20) -> List[Campaign]:
+        """
+        Get several campaigns by ID concurrently
+        
+        Args:
+            campaign_ids: Campaign IDs
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Campaigns in the order of campaign_ids
+        """
+        logger.debug(f"Getting {len(campaign_ids)} campaigns (concurrency={concurrency})")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(campaign_id: int) -> Campaign:
+            async with semaphore:
+                return await self.get_campaign(campaign_id)
+        
+        return await asyncio.gather(*(fetch(campaign_id) for campaign_id in campaign_ids))
+    
     def get_campaigns(self, limit: int = 100, offset: int = 0):
         """
         Get campaigns list (synchronous)
@@ -183,6 +265,64 @@ class CampaignAPI(BaseAPI):
         response = await self._post(f'/adv/campaigns/{campaign_id}/resume')
         return Campaign.from_api_response(response)
     
+    async def start_campaigns(self, campaign_ids: List[int]) -> Dict[str, Any]:
+        """
+        Start several campaigns in one request
+        
+        Args:
+            campaign_ids: Campaign IDs to start
+            
+        Returns:
+            API response
+        """
+        logger.info(f"Starting {len(campaign_ids)} campaigns")
+        
+        return await self._put('/adv/campaigns/play', data={'campaign_ids': campaign_ids})
+    
+    async def stop_campaigns(self, campaign_ids: List[int]) -> Dict[str, Any]:
+        """
+        Stop several campaigns in one request
+        
+        Args:
+            campaign_ids: Campaign IDs to stop
+            
+        Returns:
+            API response
+        """
+        logger.info(f"Stopping {len(campaign_ids)} campaigns")
+        
+        return await self._put('/adv/campaigns/stop', data={'campaign_ids': campaign_ids})
+    
+    async def start_campaign(self, campaign_id: int) -> Dict[str, Any]:
+        """
+        Start a campaign
+        
+        Concurrent calls made within a short window are sent together as
+        one start_campaigns request.
+        
+        Args:
+            campaign_id: Campaign ID to start
+            
+        Returns:
+            API response for the batch the campaign was sent in
+        """
+        return await self._start_batcher.submit(campaign_id)
+    
+    async def stop_campaign(self, campaign_id: int) -> Dict[str, Any]:
+        """
+        Stop a campaign
+        
+        Concurrent calls made within a short window are sent together as
+        one stop_campaigns request.
+        
+        Args:
+            campaign_id: Campaign ID to stop
+            
+        Returns:
+            API response for the batch the campaign was sent in
+        """
+        return await self._stop_batcher.submit(campaign_id)
+    
     async def clone_campaign(self, campaign_id: int, new_name: Optional[str] = None) -> Campaign:
         """
         Clone existing campaign
@@ -273,19 +413,19 @@ class CampaignAPI(BaseAPI):
         errors = []
         
         # Validate required fields
-        if not campaign_data.name or len(campaign_data.name.strip()) == 0:
+        if not campaign_data.name or not campaign_data.name.strip():
             errors.append("Campaign name is required")
         
         if not campaign_data.target_url:
             errors.append("Target URL is required")
         
-        if not campaign_data.rates or len(campaign_data.rates) == 0:
+        if not campaign_data.rates:
             errors.append("At least one rate configuration is required")
         
         # Validate targeting
         if not campaign_data.targeting:
             errors.append("Targeting configuration is required")
-        elif not campaign_data.targeting.country or len(campaign_data.targeting.country.list) == 0:
+        elif not campaign_data.targeting.country or not campaign_data.targeting.country.list:
             errors.append("At least one target country is required")
         
         # Validate budget constraints
@@ -2,10 +2,14 @@
 Collections API implementation for targeting data
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import asyncio
 import logging
 
 from .base import BaseAPI
+from ..utils.cache import TTLCache
 from ..schemas.collections import (
     Country, OS, OSVersion, Browser, Device, Carrier, 
     Zone, Language, UserActivityLevel, TargetingOptions
@@ -13,10 +17,64 @@ from ..schemas.collections import (
 
 logger = logging.getLogger(__name__)
 
+# Reference data changes rarely; repeated lookups are served from memory
+COLLECTIONS_CACHE_TTL = 3600
+
+# Zone inventory moves faster than the other collections
+COLLECTIONS_CACHE_TTL_OVERRIDES = {
+    '/adv/collections/zones': 60,
+}
+
+# Upper bound on collection requests in flight at once
+COLLECTIONS_MAX_CONCURRENCY = 8
+
 
 class CollectionsAPI(BaseAPI):
     """Collections API for targeting and reference data"""
     
+    def __init__(self, client):
+        """Initialize with client reference"""
+        super().__init__(client)
+        self._cache = TTLCache(ttl=COLLECTIONS_CACHE_TTL, maxsize=128)
+        # Last successful (response, etag) per key, used to revalidate expired
+        # entries and served if a refresh fails
+        self._stale: Dict[Any, Tuple[Dict[str, Any], Optional[str]]] = {}
+    
+    async def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make GET request, serving repeated collection lookups from cache"""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        stale_response, etag = self._stale.get(key, (None, None))
+        headers = {'If-None-Match': etag} if etag else None
+        
+        try:
+            response, response_headers = await self._request(
+                'GET', endpoint, params=params, headers=headers, with_headers=True
+            )
+        except Exception as e:
+            if stale_response is None:
+                raise
+            logger.warning("Serving stale %s after refresh failed: %s", endpoint, e)
+            return stale_response
+        
+        if response is None:
+            # 304 Not Modified: the cached body is still current
+            response = stale_response
+        else:
+            etag = response_headers.get('ETag')
+        
+        self._cache.set(key, response, ttl=COLLECTIONS_CACHE_TTL_OVERRIDES.get(endpoint))
+        self._stale[key] = (response, etag)
+        return response
+    
+    def clear_cache(self):
+        """Drop cached collection responses"""
+        self._cache.clear()
+        self._stale.clear()
+    
     def get_targeting_options(self):
         """
         Get all targeting options (synchronous)
@@ -26,26 +84,21 @@ class CollectionsAPI(BaseAPI):
         """
         logger.debug("Getting targeting options")
         
-        try:
-            # Try to get countries
-            countries_response = self.client._make_request('GET', '/adv/collections/countries')
-            countries = countries_response.json()
-        except:
-            countries = []
+        endpoints = {
+            'countries': '/adv/collections/countries',
+            'operating_systems': '/adv/collections/os',
+            'browsers': '/adv/collections/browsers',
+        }
         
-        try:
-            # Try to get OS
-            os_response = self.client._make_request('GET', '/adv/collections/os')
-            operating_systems = os_response.json()
-        except:
-            operating_systems = []
+        def fetch(endpoint):
+            try:
+                return self.client._make_request('GET', endpoint).json()
+            except Exception:
+                return []
         
-        try:
-            # Try to get browsers
-            browsers_response = self.client._make_request('GET', '/adv/collections/browsers')
-            browsers = browsers_response.json()
-        except:
-            browsers = []
+        # Independent lookups, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(endpoints), COLLECTIONS_MAX_CONCURRENCY)) as executor:
+            countries, operating_systems, browsers = executor.map(fetch, endpoints.values())
         
         return {
             'countries': countries,
@@ -330,24 +383,21 @@ class CollectionsAPI(BaseAPI):
         """
         logger.info("Getting all targeting options")
         
-        # Make parallel requests for all collections
-        import asyncio
+        # Make parallel requests for all collections, bounded to stay within the rate budget
+        semaphore = asyncio.Semaphore(COLLECTIONS_MAX_CONCURRENCY)
         
-        countries_task = self.get_countries()
-        os_task = self.get_operating_systems()
-        browsers_task = self.get_browsers()
-        devices_task = self.get_devices()
-        languages_task = self.get_languages()
-        activity_levels_task = self.get_user_activity_levels()
+        async def guarded(method):
+            async with semaphore:
+                return await method()
         
         # Wait for all requests to complete
         countries, operating_systems, browsers, devices, languages, user_activity_levels = await asyncio.gather(
-            countries_task,
-            os_task,
-            browsers_task,
-            devices_task,
-            languages_task,
-            activity_levels_task,
+            guarded(self.get_countries),
+            guarded(self.get_operating_systems),
+            guarded(self.get_browsers),
+            guarded(self.get_devices),
+            guarded(self.get_languages),
+            guarded(self.get_user_activity_levels),
             return_exceptions=True
         )
         
@@ -5,10 +5,12 @@ Statistics API implementation
 from typing import List, Optional, Dict, Any
 import logging
 from datetime import datetime, timedelta
+from pydantic import ValidationError
 
 from .base import BaseAPI
+from ..exceptions import PropellerAdsAPIError
 from ..schemas.statistics import (
-    Statistics, StatisticsFilters, StatisticsRow, 
+    Statistics, StatisticsFilters, StatisticsPage, StatisticsRow, 
     PerformanceReport, PerformanceInsight, TrendAnalysis
 )
 
@@ -65,23 +67,24 @@ class StatisticsAPI(BaseAPI):
         logger.debug(f"Getting statistics: {filters.date_from} to {filters.date_to}")
         
         params = filters.to_api_dict()
-        response = await self._get('/adv/statistics', params=params)
+        body = await self._request('GET', '/adv/statistics', params=params, raw=True)
         
-        # Parse statistics rows
-        rows = []
-        if 'data' in response:
-            rows = [StatisticsRow.from_api_response(row) for row in response['data']]
+        # Validate the JSON body straight into rows in one pydantic-core pass,
+        # without materializing an intermediate list of dicts
+        try:
+            page = StatisticsPage.model_validate_json(body)
+        except ValidationError as e:
+            raise PropellerAdsAPIError(f"Failed to parse statistics response: {e}") from e
+        rows = page.data
         
         # Calculate summary if not provided
-        summary = None
-        if 'summary' in response:
-            summary = StatisticsRow.from_api_response(response['summary'])
-        elif rows:
+        summary = page.summary
+        if summary is None and rows:
             summary = self._calculate_summary(rows)
         
         return Statistics(
             data=rows,
-            total_rows=response.get('total', len(rows)),
+            total_rows=page.total if page.total is not None else len(rows),
             summary=summary,
             date_from=filters.date_from,
             date_to=filters.date_to
@@ -327,11 +330,15 @@ class StatisticsAPI(BaseAPI):
         if not rows:
             return StatisticsRow()
         
-        total_impressions = sum(row.impressions for row in rows)
-        total_clicks = sum(row.clicks for row in rows)
-        total_conversions = sum(row.conversions for row in rows)
-        total_spend = sum(row.spend for row in rows)
-        total_revenue = sum(row.revenue for row in rows)
+        # Accumulate all totals in a single pass over the rows
+        total_impressions = total_clicks = total_conversions = 0
+        total_spend = total_revenue = 0
+        for row in rows:
+            total_impressions += row.impressions
+            total_clicks += row.clicks
+            total_conversions += row.conversions
+            total_spend += row.spend
+            total_revenue += row.revenue
         
         # Calculate averages
         ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
@@ -5,10 +5,38 @@ Async wrapper for PropellerAds Professional Client
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Coroutine, Dict, List, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 from .client import PropellerAdsClient
+from .schemas.campaign import Campaign
+from .schemas.statistics import StatisticsRow
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def run(main: Coroutine) -> Any:
+    """
+    Run a coroutine to completion, like asyncio.run().
+
+    Uses a uvloop event loop when uvloop is installed, which lowers the
+    per-await overhead of request fan-out. The global event loop policy is
+    left untouched.
+    """
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
+
+
+def _result_rows(response: Any) -> List[Dict[str, Any]]:
+    """Extract the list of rows from a list or a result/data wrapped response"""
+    if isinstance(response, dict):
+        return response.get('result', response.get('data', []))
+    return response or []
 
 
 class AsyncPropellerAdsClient:
@@ -41,7 +69,7 @@ class AsyncPropellerAdsClient:
 
     async def close(self):
         """Close the async client and cleanup resources"""
-        self._sync_client.close()
+        await self._sync_client.aclose()
         self._executor.shutdown(wait=True)
 
     async def get_balance(self) -> Any:
@@ -68,13 +96,29 @@ class AsyncPropellerAdsClient:
             lambda: self._sync_client.get_statistics(**kwargs)
         )
 
+    async def get_campaigns_typed(self, **kwargs) -> List[Campaign]:
+        """
+        Get campaigns as Campaign schema objects.
+
+        Objects are built with model_construct, skipping validation, so this
+        is only safe for data returned by the API itself.
+        """
+        campaigns = await self.get_campaigns(**kwargs)
+        return [Campaign.model_construct(**row) for row in _result_rows(campaigns)]
+
+    async def get_statistics_typed(self, **kwargs) -> List[StatisticsRow]:
+        """
+        Get statistics rows as StatisticsRow schema objects.
+
+        Objects are built with model_construct, skipping validation, so this
+        is only safe for data returned by the API itself.
+        """
+        stats = await self.get_statistics(**kwargs)
+        return [StatisticsRow.model_construct(**row) for row in _result_rows(stats)]
+
     async def health_check(self) -> Dict[str, Any]:
-        """Perform health check asynchronously"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            self._sync_client.health_check
-        )
+        """Perform health check asynchronously, probing endpoints concurrently"""
+        return await self._sync_client.health_check_async()
 
     # Delegate other methods to sync client
     def __getattr__(self, name):
@@ -5,17 +5,51 @@ Production-ready PropellerAds SSP API v5 client with enterprise features.
 """
 
 import os
+import json
 import time
+import random
+import asyncio
 import logging
+import threading
 import requests
-from typing import Optional, Dict, Any, List
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Iterable, Iterator, AsyncIterator, ClassVar, Mapping, Tuple, Union
 from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 from .exceptions import PropellerAdsError, AuthenticationError, RateLimitError, ServerError
 from .utils.rate_limiter import RateLimiter
+from .utils.cache import TTLCache
 from .monitoring.metrics import MetricsCollector
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +58,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Transient statuses retried with backoff (honouring Retry-After)
+RETRY_STATUSES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+MAX_RETRY_DELAY = 30.0
+
+# Campaign pagination: API page cap, overall cap and parallel page fetches
+CAMPAIGNS_PAGE_SIZE = 100
+MAX_CAMPAIGNS = 10000
+CAMPAIGN_PAGE_WORKERS = 8
+
+# Campaign lists are served from memory briefly; campaign writes clear them
+CAMPAIGNS_CACHE_TTL = 30
+
+# Seconds allowed to establish a connection; the read timeout is config.timeout
+CONNECT_TIMEOUT = 3.05
+
+# Per-probe bound for health_check_async, so readiness probes cannot hang
+HEALTH_CHECK_TIMEOUT = 2.0
+
+# Statistics rows converted to one Arrow record batch at a time
+ARROW_BATCH_SIZE = 10000
+
+
+def _encode_body(data: Any) -> Dict[str, Any]:
+    """Build the request body kwargs; the session already sends a JSON content type."""
+    if isinstance(data, bytes):
+        return {'data': data}
+    if ORJSON_AVAILABLE and data is not None:
+        # Non-string keys (e.g. zone IDs) are stringified, like the stdlib encoder
+        return {'data': orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)}
+    return {'json': data}
+
+
+@lru_cache(maxsize=256)
+def _encode_statistics_body(
+    date_from: str,
+    date_to: str,
+    group_by: Tuple[str, ...],
+    campaign_ids: Tuple[int, ...]
+) -> bytes:
+    """Serialize an /adv/statistics request body; repeated dashboard queries reuse the bytes."""
+    data = {
+        'day_from': date_from,
+        'day_to': date_to,
+        'tz': '+0000',
+        'group_by': list(group_by) or ['campaign_id']
+    }
+    
+    if campaign_ids:
+        data['campaign_ids'] = list(campaign_ids)
+    
+    return orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode()
+
 
 class BalanceResponse:
     """Simple balance response."""
@@ -37,6 +126,58 @@ class BalanceResponse:
         self.last_updated = datetime.now()
 
 
+def _parse_balance(balance: Any) -> BalanceResponse:
+    """Build a BalanceResponse from a decoded /adv/balance body."""
+    balance_text = str(balance).strip().strip('"')
+    
+    try:
+        amount = float(balance_text)
+    except ValueError:
+        raise PropellerAdsError(f"Invalid balance format: {balance_text}")
+    
+    return BalanceResponse(amount=amount)
+
+
+def _campaign_filters(name: Optional[str], fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Build the optional campaign list query filters (None values are not sent)."""
+    if name is not None and fields and 'name' not in fields:
+        fields = (*fields, 'name')  # needed for the exact name match
+    return {
+        'name': name,
+        'fields': ','.join(fields) if fields else None
+    }
+
+
+def _match_campaign_name(campaigns: List[Dict[str, Any]], name: str) -> List[Dict[str, Any]]:
+    """Keep exact name matches (the API may ignore or loosely match the name filter)."""
+    return [campaign for campaign in campaigns if campaign.get('name') == name]
+
+
+def _copy_campaigns(campaigns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy cached campaigns so callers editing a result do not change the cache."""
+    return [dict(campaign) if isinstance(campaign, dict) else campaign for campaign in campaigns]
+
+
+class _CappedRetry(Retry):
+    """urllib3 retry policy that honours Retry-After up to MAX_RETRY_DELAY, like the async path."""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_DELAY)
+
+
+class _BufferedResponse:
+    """Already-read async response with the subset of ``requests.Response`` used for error handling."""
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+    def json(self):
+        return _json_loads(self.text)
+
+
 class PropellerAdsClient:
     """
     Professional PropellerAds SSP API v5 Client.
@@ -51,6 +192,22 @@ class PropellerAdsClient:
     - Connection pooling
     """
     
+    # Headers shared by every client; only Authorization varies per instance
+    _BASE_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'User-Agent': 'PropellerAds-Python-SDK/1.0.0'
+    })
+    
+    # Campaign endpoint templates, formatted with the campaign ID
+    _CAMPAIGN_PATH = "/adv/campaigns/{}".format
+    _CAMPAIGN_CREATIVES_PATH = "/adv/campaigns/{}/creatives".format
+    _CAMPAIGN_TARGETING_PATH = "/adv/campaigns/{}/targeting".format
+    _CAMPAIGN_SLICES_PATH = "/adv/campaigns/{}/slices".format
+    _CAMPAIGN_ZONES_PATH = "/adv/campaigns/{}/zones".format
+    
     def __init__(
         self,
         api_key: str,
@@ -85,10 +242,14 @@ class PropellerAdsClient:
         if not api_key:
             raise ValueError("API key is required")
         
-        # Initialize components
-        self.session = self._create_session()
+        # Initialize components (the HTTP session is built on first use)
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
         self.rate_limiter = RateLimiter(max_requests=rate_limit, time_window=60)
         self.metrics = MetricsCollector() if enable_metrics else None
+        self._async_session = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._campaigns_cache = TTLCache(ttl=CAMPAIGNS_CACHE_TTL, maxsize=32)
         
         # Circuit breaker state
         self.circuit_breaker = {
@@ -101,23 +262,40 @@ class PropellerAdsClient:
         
         logger.info(f"PropellerAds client initialized (rate_limit: {rate_limit}/min)")
     
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session, built on first use so config-only clients stay cheap."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+    
     def _create_session(self) -> requests.Session:
         """Create configured requests session."""
         session = requests.Session()
         
         # Set headers
-        session.headers.update({
-            'Authorization': f'Bearer {self.config.api_key}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'User-Agent': 'PropellerAds-Python-SDK/1.0.0'
-        })
-        
-        # Configure adapters for connection pooling
+        session.headers.update(self._BASE_HEADERS)
+        session.headers['Authorization'] = f'Bearer {self.config.api_key}'
+        
+        # Configure adapters for connection pooling. Connection errors are
+        # retried in _make_request; the adapter only retries transient statuses.
+        retry = _CappedRetry(
+            total=self.config.max_retries,
+            connect=0,
+            read=0,
+            other=0,
+            status=self.config.max_retries,
+            status_forcelist=RETRY_STATUSES,
+            backoff_factor=0.5,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
         adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
-            max_retries=0  # We handle retries manually
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=retry
         )
         session.mount('http://', adapter)
         session.mount('https://', adapter)
@@ -140,6 +318,8 @@ class PropellerAdsClient:
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
+            timeout: Optional seconds or (connect, read) tuple; defaults to
+                (CONNECT_TIMEOUT, config.timeout)
             
         Returns:
             requests.Response: API response
@@ -157,6 +337,10 @@ class PropellerAdsClient:
         url = f"{self.config.base_url}{endpoint}"
         request_id = f"req_{int(time.time() * 1000)}"
         
+        # Handle json and timeout parameters from kwargs
+        body = _encode_body(kwargs.pop('json', data))
+        timeout = kwargs.pop('timeout', None) or (CONNECT_TIMEOUT, self.config.timeout)
+        
         # Metrics
         if self.metrics:
             self.metrics.record_request_start(method, endpoint)
@@ -168,15 +352,12 @@ class PropellerAdsClient:
                 start_time = time.time()
                 
                 # Make request
-                # Handle json parameter from kwargs
-                json_data = kwargs.pop('json', data)
-                
                 response = self.session.request(
                     method=method,
                     url=url,
-                    json=json_data,
                     params=params,
-                    timeout=self.config.timeout,
+                    timeout=timeout,
+                    **body,
                     **kwargs
                 )
                 
@@ -221,6 +402,166 @@ class PropellerAdsClient:
         # All retries failed
         raise PropellerAdsError(f"Request failed after {self.config.max_retries + 1} attempts: {str(last_exception)}")
     
+    def _get_async_session(self) -> "aiohttp.ClientSession":
+        """
+        Get or lazily create the shared aiohttp session.
+        
+        An aiohttp session is bound to the event loop it was created on, so a
+        new one is created when the client is used from a different loop (for
+        example a second ``asyncio.run``).
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_session is None
+            or self._async_session.closed
+            or self._async_session_loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75
+            )
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout, connect=5),
+                headers=dict(self.session.headers)
+            )
+            self._async_session_loop = loop
+        return self._async_session
+    
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Make API request on the event loop without blocking.
+        
+        Uses a shared aiohttp session so independent calls can be awaited
+        concurrently. Retry, circuit breaker and error mapping match
+        ``_make_request``.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            data: Request body data
+            params: Query parameters
+            
+        Returns:
+            Any: Decoded JSON response body (raw text if not JSON)
+            
+        Raises:
+            PropellerAdsError: On API errors
+        """
+        if not AIOHTTP_AVAILABLE:
+            response = await asyncio.to_thread(
+                self._make_request, method, endpoint, data=data, params=params
+            )
+            try:
+                return response.json()
+            except ValueError:
+                return response.text
+        
+        # Check circuit breaker
+        self._check_circuit_breaker()
+        
+        # Rate limiting without blocking the event loop
+        while not self.rate_limiter.try_acquire():
+            await asyncio.sleep(self.rate_limiter.wait_for_capacity())
+        
+        # Prepare request
+        url = f"{self.config.base_url}{endpoint}"
+        request_id = f"req_{int(time.time() * 1000)}"
+        query = [
+            (key, item)
+            for key, value in (params or {}).items()
+            if value is not None
+            for item in (value if isinstance(value, (list, tuple)) else [value])
+        ]
+        session = self._get_async_session()
+        body = _encode_body(data)
+        
+        # Metrics
+        if self.metrics:
+            self.metrics.record_request_start(method, endpoint)
+        
+        # Retry logic
+        last_exception = None
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                start_time = time.time()
+                
+                async with session.request(method, url, params=query, **body) as resp:
+                    status_code = resp.status
+                    retry_after = resp.headers.get('Retry-After')
+                    content = await resp.read()
+                
+                response_time = time.time() - start_time
+                
+                logger.info(
+                    "🌐 %s %s → %s (%.3fs) [ID: %s]",
+                    method, endpoint, status_code, response_time, request_id
+                )
+                
+                if (
+                    status_code in RETRY_STATUSES
+                    and attempt < self.config.max_retries
+                    and (status_code == 429 or method.upper() in IDEMPOTENT_METHODS)
+                ):
+                    wait_time = self._retry_delay(attempt, retry_after)
+                    logger.warning(
+                        "⚠️ HTTP %s (attempt %d/%d), retrying in %.1fs",
+                        status_code, attempt + 1, self.config.max_retries + 1, wait_time
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                
+                if status_code >= 400:
+                    text = content.decode('utf-8', 'replace')
+                    self._handle_error_response(_BufferedResponse(status_code, text), request_id)
+                
+                self._record_success()
+                
+                if self.metrics:
+                    self.metrics.record_request_success(response_time)
+                
+                try:
+                    return _json_loads(content)
+                except ValueError:
+                    return content.decode('utf-8', 'replace')
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_exception = e
+                self._record_failure()
+                
+                if self.metrics:
+                    self.metrics.record_request_error(type(e).__name__)
+                
+                if attempt < self.config.max_retries:
+                    wait_time = self._retry_delay(attempt)
+                    logger.warning(
+                        "⚠️ Request failed (attempt %d/%d), retrying in %.1fs: %s",
+                        attempt + 1, self.config.max_retries + 1, wait_time, e
+                    )
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error("❌ Request failed after %d attempts: %s", self.config.max_retries + 1, e)
+        
+        # All retries failed
+        raise PropellerAdsError(f"Request failed after {self.config.max_retries + 1} attempts: {str(last_exception)}")
+    
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Backoff before the next attempt: Retry-After if given, else jittered exponential."""
+        if retry_after:
+            try:
+                return min(MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; fall back to computed backoff
+        return min(MAX_RETRY_DELAY, random.uniform(0.5, 1.5 * 2 ** attempt))
+    
     def _handle_error_response(self, response: requests.Response, request_id: str):
         """Handle error response."""
         try:
@@ -241,12 +582,12 @@ class PropellerAdsClient:
                     message = '; '.join(error_details)
             
             # Add full response for debugging
-            print(f"DEBUG API Response: {response.text}")
+            logger.debug("API error response: %s", response.text)
             
         except:
             message = response.text or f"HTTP {response.status_code} error"
             error_data = None
-            print(f"DEBUG Raw Response: {response.text}")
+            logger.debug("API raw error response: %s", response.text)
         
         # Create appropriate exception
         if response.status_code == 401:
@@ -292,19 +633,20 @@ class PropellerAdsClient:
             if self.metrics:
                 self.metrics.record_circuit_breaker_trip()
     
-    def get_balance(self) -> BalanceResponse:
+    def get_balance(self, request_timeout: Optional[Union[float, Tuple[float, float]]] = None) -> BalanceResponse:
         """
         Get account balance.
         
+        Args:
+            request_timeout: Optional seconds or (connect, read) tuple for this call
+            
         Returns:
             BalanceResponse: Account balance information
         """
-        response = self._make_request('GET', '/adv/balance')
+        response = self._make_request('GET', '/adv/balance', timeout=request_timeout)
         
-        # Handle plain text response
-        balance_text = response.text.strip()
-        if balance_text.startswith('"') and balance_text.endswith('"'):
-            balance_text = balance_text[1:-1]
+        # Handle plain text response, optionally wrapped in quotes
+        balance_text = response.text.strip().strip('"')
         
         try:
             amount = float(balance_text)
@@ -313,7 +655,25 @@ class PropellerAdsClient:
         
         return BalanceResponse(amount=amount)
     
-    def get_campaigns(self, limit: int = 100, offset: int = 0, auto_paginate: bool = True) -> List[Dict[str, Any]]:
+    async def get_balance_async(self) -> BalanceResponse:
+        """
+        Get account balance without blocking the event loop.
+        
+        Returns:
+            BalanceResponse: Account balance information
+        """
+        balance = await self._make_request_async('GET', '/adv/balance')
+        return _parse_balance(balance)
+    
+    def get_campaigns(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        auto_paginate: bool = True,
+        request_timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        name: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get campaigns list with automatic pagination support.
         
@@ -321,56 +681,289 @@ class PropellerAdsClient:
             limit: Number of campaigns per page (max 100)
             offset: Offset for pagination (used when auto_paginate=False)
             auto_paginate: If True, automatically fetch all campaigns across all pages
+            request_timeout: Optional seconds or (connect, read) tuple per page request
+            name: Only return campaigns with this exact name (sent as a query filter)
+            fields: Only request these campaign fields, to shrink responses
             
         Returns:
-            List[Dict]: List of campaigns
-        """
+            List[Dict]: List of campaigns. Each call gets its own campaign dicts;
+            nested values are shared with the cache and should not be modified.
+        """
+        filters = _campaign_filters(name, fields)
+        key = (limit, offset, auto_paginate, *filters.values())
+        campaigns = self._campaigns_cache.get(key)
+        if campaigns is None:
+            campaigns = self._fetch_campaigns(limit, offset, auto_paginate, request_timeout, filters)
+            if name is not None:
+                campaigns = _match_campaign_name(campaigns, name)
+            self._campaigns_cache.set(key, campaigns)
+        return _copy_campaigns(campaigns)
+    
+    async def get_campaigns_async(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        auto_paginate: bool = True,
+        name: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get campaigns list without blocking the event loop.
+        
+        Shares the campaign cache with get_campaigns. When auto-paginating,
+        pages after the first are requested concurrently.
+        
+        Args:
+            limit: Number of campaigns per page (max 100)
+            offset: Offset for pagination (used when auto_paginate=False)
+            auto_paginate: If True, automatically fetch all campaigns across all pages
+            name: Only return campaigns with this exact name (sent as a query filter)
+            fields: Only request these campaign fields, to shrink responses
+            
+        Returns:
+            List[Dict]: List of campaigns. Each call gets its own campaign dicts;
+            nested values are shared with the cache and should not be modified.
+        """
+        filters = _campaign_filters(name, fields)
+        key = (limit, offset, auto_paginate, *filters.values())
+        campaigns = self._campaigns_cache.get(key)
+        if campaigns is None:
+            campaigns = await self._fetch_campaigns_async(limit, offset, auto_paginate, filters)
+            if name is not None:
+                campaigns = _match_campaign_name(campaigns, name)
+            self._campaigns_cache.set(key, campaigns)
+        return _copy_campaigns(campaigns)
+    
+    def _invalidate_campaigns_cache(self):
+        """Drop cached campaign lists after a campaign write."""
+        self._campaigns_cache.clear()
+    
+    def _fetch_campaigns(
+        self,
+        limit: int,
+        offset: int,
+        auto_paginate: bool,
+        request_timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch campaigns from the API (see get_campaigns)."""
         if not auto_paginate:
             # Single page request
             params = {
                 'limit': limit,
-                'offset': offset
+                'offset': offset,
+                **(filters or {})
             }
-            response = self._make_request('GET', '/adv/campaigns', params=params)
+            response = self._make_request('GET', '/adv/campaigns', params=params, timeout=request_timeout)
             response_data = response.json()
             return response_data.get('result', [])
         
-        # Auto-pagination: fetch all campaigns
-        all_campaigns = []
-        current_offset = 0
-        page_size = min(limit, 100)  # API max is 100
+        # Auto-pagination: the first page reports the total, the rest are fetched concurrently
+        page_size = min(limit, CAMPAIGNS_PAGE_SIZE)  # API max is 100
         
-        while True:
+        def fetch_page(page_offset: int) -> Dict[str, Any]:
             params = {
                 'limit': page_size,
-                'offset': current_offset
+                'offset': page_offset,
+                **(filters or {})
             }
+            return self._make_request('GET', '/adv/campaigns', params=params, timeout=request_timeout).json()
+        
+        first_page = fetch_page(0)
+        all_campaigns = list(first_page.get('result', []))
+        total_items = first_page.get('meta', {}).get('total_items', 0)
+        
+        # Safety check to prevent unbounded pagination
+        if total_items > MAX_CAMPAIGNS + page_size:
+            logger.warning("⚠️ Reached maximum pagination limit (10k campaigns)")
+        offsets = range(page_size, min(total_items, MAX_CAMPAIGNS + 1), page_size) if all_campaigns else range(0)
+        
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(len(offsets), CAMPAIGN_PAGE_WORKERS)) as executor:
+                for page in executor.map(fetch_page, offsets):
+                    all_campaigns.extend(page.get('result', []))
+        
+        logger.info(f"📊 Loaded {len(all_campaigns)} campaigns across {len(offsets) + 1} pages")
+        return all_campaigns
+    
+    async def _fetch_campaigns_async(
+        self,
+        limit: int,
+        offset: int,
+        auto_paginate: bool,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch campaigns from the API (see get_campaigns_async)."""
+        if not auto_paginate:
+            params = {'limit': limit, 'offset': offset, **(filters or {})}
+            response_data = await self._make_request_async('GET', '/adv/campaigns', params=params)
+            return response_data.get('result', [])
+        
+        page_size = min(limit, CAMPAIGNS_PAGE_SIZE)  # API max is 100
+        
+        def fetch_page(page_offset: int):
+            params = {'limit': page_size, 'offset': page_offset, **(filters or {})}
+            return self._make_request_async('GET', '/adv/campaigns', params=params)
+        
+        first_page = await fetch_page(0)
+        all_campaigns = list(first_page.get('result', []))
+        total_items = first_page.get('meta', {}).get('total_items', 0)
+        
+        if total_items > MAX_CAMPAIGNS + page_size:
+            logger.warning("⚠️ Reached maximum pagination limit (10k campaigns)")
+        offsets = range(page_size, min(total_items, MAX_CAMPAIGNS + 1), page_size) if all_campaigns else range(0)
+        
+        for page in await asyncio.gather(*(fetch_page(page_offset) for page_offset in offsets)):
+            all_campaigns.extend(page.get('result', []))
+        
+        logger.info(f"📊 Loaded {len(all_campaigns)} campaigns across {len(offsets) + 1} pages")
+        return all_campaigns
+    
+    def count_campaigns(self, request_timeout: Optional[Union[float, Tuple[float, float]]] = None) -> int:
+        """
+        Count campaigns without downloading the campaign list.
+        
+        Uses the total reported with a one-item page, falling back to
+        walking the pages lazily if the API omits it.
+        
+        Args:
+            request_timeout: Optional seconds or (connect, read) tuple per request
             
-            response = self._make_request('GET', '/adv/campaigns', params=params)
-            response_data = response.json()
+        Returns:
+            int: Number of campaigns
+        """
+        params = {'limit': 1, 'offset': 0}
+        response_data = self._make_request('GET', '/adv/campaigns', params=params, timeout=request_timeout).json()
+        
+        meta = response_data.get('meta', {})
+        if 'total_items' in meta:
+            return meta['total_items']
+        return sum(1 for _ in self.iter_all_campaigns(request_timeout=request_timeout))
+    
+    def iter_all_campaigns(
+        self,
+        page_size: int = 100,
+        request_timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all campaigns.
+        
+        Synchronous counterpart of iter_campaigns: each page is requested
+        only when the previous one has been consumed, so at most one page
+        is held in memory. Prefer get_campaigns when the full list is needed,
+        since it fetches pages concurrently.
+        
+        Args:
+            page_size: Number of campaigns per page (max 100)
+            request_timeout: Optional seconds or (connect, read) tuple per page request
+            
+        Yields:
+            Dict: Campaign data
+        """
+        for page in self._iter_campaign_pages(page_size, request_timeout):
+            yield from page
+    
+    def find_campaign_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the first campaign with the given name.
+        
+        Pages are fetched one at a time and the search stops at the first
+        match, so later pages are never requested.
+        
+        Args:
+            name: Exact campaign name
+            
+        Returns:
+            Optional[Dict]: Matching campaign, or None
+        """
+        for campaign in self.iter_all_campaigns():
+            if campaign.get('name') == name:
+                return campaign
+        return None
+    
+    def get_campaigns_by_name_index(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Get all campaigns indexed by name.
+        
+        The index is built once from the cached campaign list and cleared
+        together with it on campaign writes, so repeated lookups are O(1).
+        When several campaigns share a name, the first one listed wins.
+        
+        Returns:
+            Mapping: Campaign name -> campaign
+        """
+        index = self._campaigns_cache.get('by_name')
+        if index is None:
+            by_name = {}
+            for campaign in self.get_campaigns():
+                by_name.setdefault(campaign.get('name'), campaign)
+            index = MappingProxyType(by_name)
+            self._campaigns_cache.set('by_name', index)
+        return index
+    
+    def _iter_campaign_pages(
+        self,
+        page_size: int = CAMPAIGNS_PAGE_SIZE,
+        request_timeout: Optional[Union[float, Tuple[float, float]]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield campaign pages in order, requesting each only when needed."""
+        page_size = min(page_size, CAMPAIGNS_PAGE_SIZE)  # API max is 100
+        offset = 0
+        
+        while offset <= MAX_CAMPAIGNS:
+            params = {'limit': page_size, 'offset': offset}
+            response_data = self._make_request('GET', '/adv/campaigns', params=params, timeout=request_timeout).json()
             
             campaigns = response_data.get('result', [])
             if not campaigns:
-                break
-                
-            all_campaigns.extend(campaigns)
-            
-            # Check if we have more pages
-            meta = response_data.get('meta', {})
-            total_items = meta.get('total_items', 0)
+                return
+            yield campaigns
             
-            if len(all_campaigns) >= total_items:
-                break
-                
-            current_offset += page_size
+            offset += page_size
+            if offset >= response_data.get('meta', {}).get('total_items', 0):
+                return
+    
+    async def iter_campaigns(self, page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all campaigns, fetching pages in the background.
+        
+        The next page is requested while the caller is still consuming the
+        current one, so page round-trips overlap with caller work. When
+        breaking out early, wrap the iterator in ``contextlib.aclosing`` so
+        the pending prefetch is cancelled before the client is closed.
+        
+        Args:
+            page_size: Number of campaigns per page (max 100)
             
-            # Safety check to prevent infinite loops
-            if current_offset > 10000:  # Max 10k campaigns
-                logger.warning("⚠️ Reached maximum pagination limit (10k campaigns)")
-                break
+        Yields:
+            Dict: Campaign
+        """
+        page_size = min(page_size, CAMPAIGNS_PAGE_SIZE)  # API max is 100
         
-        logger.info(f"📊 Loaded {len(all_campaigns)} campaigns across {(current_offset // page_size) + 1} pages")
-        return all_campaigns
+        def fetch(offset: int) -> "asyncio.Task":
+            params = {'limit': page_size, 'offset': offset}
+            return asyncio.create_task(self._make_request_async('GET', '/adv/campaigns', params=params))
+        
+        offset = 0
+        next_page = fetch(offset)
+        try:
+            while next_page is not None:
+                response_data = await next_page
+                next_page = None
+                
+                campaigns = response_data.get('result', [])
+                total_items = response_data.get('meta', {}).get('total_items', 0)
+                offset += page_size
+                
+                # Same stopping rules as get_campaigns(auto_paginate=True)
+                if campaigns and offset < total_items and offset <= MAX_CAMPAIGNS:
+                    next_page = fetch(offset)
+                
+                for campaign in campaigns:
+                    yield campaign
+        finally:
+            if next_page is not None:
+                next_page.cancel()
     
     def get_statistics(
         self,
@@ -391,19 +984,102 @@ class PropellerAdsClient:
         Returns:
             Dict: Statistics data
         """
-        data = {
-            'day_from': date_from,
-            'day_to': date_to,
-            'tz': '+0000',
-            'group_by': group_by or ['campaign_id']
-        }
-        
-        if campaign_ids:
-            data['campaign_ids'] = campaign_ids
-        
+        data = self._statistics_body(date_from, date_to, group_by, campaign_ids)
         response = self._make_request('POST', '/adv/statistics', data=data)
         return response.json()
     
+    def iter_statistics(
+        self,
+        date_from: str,
+        date_to: str,
+        group_by: List[str] = None,
+        campaign_ids: Optional[List[int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over statistics rows as they are downloaded.
+        
+        With ijson installed the response is parsed incrementally, so memory
+        stays bounded for wide ``group_by`` reports. Without it the body is
+        decoded in one go and rows are yielded from the result.
+        
+        Args:
+            date_from: Start date (YYYY-MM-DD HH:MM:SS)
+            date_to: End date (YYYY-MM-DD HH:MM:SS)
+            group_by: Grouping fields
+            campaign_ids: Filter by campaign IDs
+            
+        Yields:
+            Dict: Statistics row
+        """
+        data = self._statistics_body(date_from, date_to, group_by, campaign_ids)
+        response = self._make_request('POST', '/adv/statistics', data=data, stream=True)
+        
+        try:
+            if IJSON_AVAILABLE:
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, 'result.item', use_float=True)
+            else:
+                yield from response.json().get('result', [])
+        finally:
+            response.close()
+    
+    def get_statistics_arrow(
+        self,
+        date_from: str,
+        date_to: str,
+        group_by: List[str] = None,
+        campaign_ids: Optional[List[int]] = None,
+        schema: Optional["pa.Schema"] = None
+    ) -> "pa.Table":
+        """
+        Get statistics as a columnar PyArrow table.
+        
+        With a ``schema``, rows streamed from ``iter_statistics`` are converted
+        ``ARROW_BATCH_SIZE`` at a time, so only one batch of row dicts is held
+        in memory. Without one, column types are inferred from every row, so
+        all rows are collected before the table is built.
+        
+        Args:
+            date_from: Start date (YYYY-MM-DD HH:MM:SS)
+            date_to: End date (YYYY-MM-DD HH:MM:SS)
+            group_by: Grouping fields
+            campaign_ids: Filter by campaign IDs
+            schema: Column types; inferred from the rows if omitted
+            
+        Returns:
+            pa.Table: Statistics table
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for get_statistics_arrow. Install with: pip install pyarrow")
+        
+        rows = self.iter_statistics(date_from, date_to, group_by, campaign_ids)
+        if schema is None:
+            return pa.Table.from_pylist(list(rows))
+        
+        batches = [
+            pa.RecordBatch.from_pylist(chunk, schema=schema)
+            for chunk in iter(lambda: list(islice(rows, ARROW_BATCH_SIZE)), [])
+        ]
+        return pa.Table.from_batches(batches, schema=schema)
+    
+    @staticmethod
+    def _statistics_body(
+        date_from: str,
+        date_to: str,
+        group_by: Optional[List[str]],
+        campaign_ids: Optional[List[int]]
+    ) -> bytes:
+        """Build the serialized /adv/statistics request body."""
+        return _encode_statistics_body(
+            date_from,
+            date_to,
+            tuple(group_by or ()),
+            tuple(campaign_ids or ())
+        )
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Perform health check.
@@ -442,10 +1118,73 @@ class PropellerAdsClient:
                 'circuit_breaker': self.circuit_breaker
             }
     
+    async def health_check_async(self, timeout: float = HEALTH_CHECK_TIMEOUT) -> Dict[str, Any]:
+        """
+        Perform health check with concurrent, time-bounded probes.
+        
+        Balance, campaigns and collections endpoints are probed at once, each
+        limited to ``timeout`` seconds. A failing balance probe (including an
+        unparseable balance) makes the client unhealthy; any other failing
+        probe makes it degraded.
+        
+        The result has the keys of ``health_check`` plus ``checks`` with the
+        per-probe outcome, and ``overall_status`` may also be ``'degraded'``.
+        
+        Args:
+            timeout: Seconds allowed per probe
+            
+        Returns:
+            Dict: Health status information
+        """
+        start_time = time.time()
+        
+        probes = {
+            'balance': self._make_request_async('GET', '/adv/balance'),
+            'campaigns': self._make_request_async('GET', '/adv/campaigns', params={'limit': 1, 'offset': 0}),
+            'collections': self._make_request_async('GET', '/adv/collections/countries'),
+        }
+        results = await asyncio.gather(
+            *(asyncio.wait_for(probe, timeout) for probe in probes.values()),
+            return_exceptions=True
+        )
+        response_time = time.time() - start_time
+        
+        errors = {
+            name: f"{type(result).__name__}: {result}"
+            for name, result in zip(probes, results)
+            if isinstance(result, Exception)
+        }
+        
+        # An unparseable balance body fails the balance check
+        balance = None
+        if 'balance' not in errors:
+            try:
+                balance = _parse_balance(results[0])
+            except PropellerAdsError as e:
+                errors['balance'] = f"{type(e).__name__}: {e}"
+        
+        health = {
+            'timestamp': datetime.now().isoformat(),
+            'response_time': round(response_time, 3),
+            'checks': {name: errors.get(name, 'ok') for name in probes},
+            'rate_limiter': self.rate_limiter.get_status(),
+            'circuit_breaker': self.circuit_breaker,
+            'metrics': self.metrics.get_summary() if self.metrics else {}
+        }
+        
+        if 'balance' in errors:
+            health['overall_status'] = 'unhealthy'
+            health['error'] = errors['balance']
+        else:
+            health['overall_status'] = 'degraded' if errors else 'healthy'
+            health['balance'] = balance.formatted
+        
+        return health
+    
     def close(self):
         """Close the client and cleanup resources."""
-        if self.session:
-            self.session.close()
+        if self._session is not None:
+            self._session.close()
         logger.info("PropellerAds client closed")
     
     def __enter__(self):
@@ -455,6 +1194,27 @@ class PropellerAdsClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+    
+    async def aclose(self):
+        """Close the async session and the sync session."""
+        # A session left over from another (finished) loop cannot be awaited here
+        if (
+            self._async_session is not None
+            and not self._async_session.closed
+            and self._async_session_loop is asyncio.get_running_loop()
+        ):
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+        self.close()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
 
 
 
@@ -469,8 +1229,23 @@ class PropellerAdsClient:
             Dict: The created campaign data.
         """
         response = self._make_request("POST", "/adv/campaigns", data=campaign_data)
+        self._invalidate_campaigns_cache()
         return response.json()
 
+    async def create_campaign_async(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new campaign without blocking the event loop.
+
+        Args:
+            campaign_data: Dictionary with campaign data.
+
+        Returns:
+            Dict: The created campaign data.
+        """
+        campaign = await self._make_request_async("POST", "/adv/campaigns", data=campaign_data)
+        self._invalidate_campaigns_cache()
+        return campaign
+
 
 
 
@@ -485,7 +1260,8 @@ class PropellerAdsClient:
         Returns:
             Dict: The updated campaign data.
         """
-        response = self._make_request("PUT", f"/adv/campaigns/{campaign_id}", data=campaign_data)
+        response = self._make_request("PUT", self._CAMPAIGN_PATH(campaign_id), data=campaign_data)
+        self._invalidate_campaigns_cache()
         return response.json()
 
 
@@ -498,7 +1274,8 @@ class PropellerAdsClient:
         Args:
             campaign_id: The ID of the campaign to delete.
         """
-        self._make_request("DELETE", f"/adv/campaigns/{campaign_id}")
+        self._make_request("DELETE", self._CAMPAIGN_PATH(campaign_id))
+        self._invalidate_campaigns_cache()
 
 
 
@@ -935,7 +1712,7 @@ class PropellerAdsClient:
         Returns:
             Dict: A dictionary containing the campaign creatives.
         """
-        response = self._make_request("GET", f"/adv/campaigns/{campaign_id}/creatives")
+        response = self._make_request("GET", self._CAMPAIGN_CREATIVES_PATH(campaign_id))
         return response.json()
 
 
@@ -951,7 +1728,7 @@ class PropellerAdsClient:
         Returns:
             Dict: A dictionary containing the campaign targeting.
         """
-        response = self._make_request("GET", f"/adv/campaigns/{campaign_id}/targeting")
+        response = self._make_request("GET", self._CAMPAIGN_TARGETING_PATH(campaign_id))
         return response.json()
 
 
@@ -967,7 +1744,7 @@ class PropellerAdsClient:
         Returns:
             Dict: A dictionary containing the campaign slices.
         """
-        response = self._make_request("GET", f"/adv/campaigns/{campaign_id}/slices")
+        response = self._make_request("GET", self._CAMPAIGN_SLICES_PATH(campaign_id))
         return response.json()
 
 
@@ -983,7 +1760,7 @@ class PropellerAdsClient:
         Returns:
             Dict: A dictionary containing the campaign zones.
         """
-        response = self._make_request("GET", f"/adv/campaigns/{campaign_id}/zones")
+        response = self._make_request("GET", self._CAMPAIGN_ZONES_PATH(campaign_id))
         return response.json()
 
 
@@ -1000,7 +1777,8 @@ class PropellerAdsClient:
         Returns:
             Dict: A dictionary containing the updated campaign targeting.
         """
-        response = self._make_request("PUT", f"/adv/campaigns/{campaign_id}/targeting", json=targeting_data)
+        response = self._make_request("PUT", self._CAMPAIGN_TARGETING_PATH(campaign_id), json=targeting_data)
+        self._invalidate_campaigns_cache()
         return response.json()
 
 
@@ -1017,7 +1795,8 @@ class PropellerAdsClient:
         Returns:
             Dict: A dictionary containing the updated campaign slices.
         """
-        response = self._make_request("PUT", f"/adv/campaigns/{campaign_id}/slices", json=slices_data)
+        response = self._make_request("PUT", self._CAMPAIGN_SLICES_PATH(campaign_id), json=slices_data)
+        self._invalidate_campaigns_cache()
         return response.json()
 
 
@@ -1034,7 +1813,8 @@ class PropellerAdsClient:
         Returns:
             Dict: A dictionary containing the updated campaign zones.
         """
-        response = self._make_request("PUT", f"/adv/campaigns/{campaign_id}/zones", json=zones_data)
+        response = self._make_request("PUT", self._CAMPAIGN_ZONES_PATH(campaign_id), json=zones_data)
+        self._invalidate_campaigns_cache()
         return response.json()
 
 
@@ -1049,6 +1829,76 @@ class PropellerAdsClient:
         Returns:
             Dict: Full campaign information.
         """
-        endpoint = f"/adv/campaigns/{campaign_id}"
-        response = self._make_request("GET", endpoint)
+        response = self._make_request("GET", self._CAMPAIGN_PATH(campaign_id))
         return response.json()
+
+    async def get_campaign_full_info_async(self, campaign_id: int) -> Dict[str, Any]:
+        """
+        Get campaign details together with its targeting, creatives, slices and zones.
+
+        All sub-resources are requested concurrently. A failing sub-request
+        does not abort the others; its error message is reported under
+        ``errors`` and its entry is set to None.
+
+        Args:
+            campaign_id: Numeric ID of the campaign.
+
+        Returns:
+            Dict: Campaign information keyed by part, plus ``errors``.
+        """
+        parts = {
+            'campaign': self._CAMPAIGN_PATH(campaign_id),
+            'targeting': self._CAMPAIGN_TARGETING_PATH(campaign_id),
+            'creatives': self._CAMPAIGN_CREATIVES_PATH(campaign_id),
+            'slices': self._CAMPAIGN_SLICES_PATH(campaign_id),
+            'zones': self._CAMPAIGN_ZONES_PATH(campaign_id),
+        }
+        results = await asyncio.gather(
+            *(self._make_request_async("GET", endpoint) for endpoint in parts.values()),
+            return_exceptions=True
+        )
+
+        campaign_info = {
+            part: None if isinstance(result, Exception) else result
+            for part, result in zip(parts, results)
+        }
+        campaign_info['errors'] = {
+            part: str(result)
+            for part, result in zip(parts, results)
+            if isinstance(result, Exception)
+        }
+        return campaign_info
+
+
+# Process-wide client shared by request handlers, so they reuse one connection pool
+_shared_client: Optional[PropellerAdsClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client(api_key: Optional[str] = None, **kwargs) -> PropellerAdsClient:
+    """
+    Get the process-wide shared client, creating it on first use.
+    
+    Args:
+        api_key: PropellerAds API key (defaults to the MainAPI environment variable)
+        **kwargs: Extra PropellerAdsClient options, used only on creation
+        
+    Returns:
+        PropellerAdsClient: Shared client instance
+    """
+    global _shared_client
+    
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = PropellerAdsClient(api_key or os.getenv("MainAPI"), **kwargs)
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared client (e.g. on application shutdown)."""
+    global _shared_client
+    
+    client, _shared_client = _shared_client, None
+    if client is not None:
+        await client.aclose()
@@ -86,7 +86,8 @@ class EnhancedPropellerAdsClient:
         api_key: str,
         base_url: str = "https://ssp-api.propellerads.com/v5",
         config: Optional[ClientConfig] = None,
-        enable_metrics: bool = True
+        enable_metrics: bool = True,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize PropellerAds client.
@@ -96,19 +97,24 @@ class EnhancedPropellerAdsClient:
             base_url: API base URL
             config: Client configuration
             enable_metrics: Enable metrics collection
+            session: Shared requests session (a pooled one is created if omitted)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.config = config or ClientConfig()
         
         # Initialize session
-        self.session = requests.Session()
+        self.session = session or self._create_session()
         self.session.headers.update({
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json',
             'User-Agent': 'PropellerAds-Python-SDK/2.0.0'
         })
         
+        # aiohttp session for the async API methods, created on first use and
+        # shared by all API modules
+        self.async_session = None
+        
         # Initialize components
         self.rate_limiter = RateLimiter(self.config.rate_limit)
         self.metrics = MetricsCollector() if enable_metrics else None
@@ -129,6 +135,21 @@ class EnhancedPropellerAdsClient:
         
         logger.info(f"Enhanced PropellerAds client initialized (rate_limit: {self.config.rate_limit}/min)")
     
+    def _create_session(self) -> requests.Session:
+        """Create requests session with keep-alive connection pooling."""
+        session = requests.Session()
+        
+        # Configure adapters for connection pooling
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=0  # We handle retries manually
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        return session
+    
     def _make_request(
         self,
         method: str,
@@ -437,6 +458,14 @@ class EnhancedPropellerAdsClient:
             self.session.close()
         logger.info("Enhanced PropellerAds client closed")
     
+    async def aclose(self):
+        """Close the shared async session and the client."""
+        # Stops the campaign start/stop batch workers as well
+        await self.campaigns.close()
+        if self.async_session is not None and not self.async_session.closed:
+            await self.async_session.close()
+        self.close()
+    
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -12,8 +12,17 @@ import sys
 import asyncio
 import logging
 import json
-from typing import Any, Dict, List, Optional, Sequence
+import hashlib
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import (
+    Any, Awaitable, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence
+)
 from pathlib import Path
+from types import MappingProxyType
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent))
@@ -42,13 +51,29 @@ except ImportError:
     class ImageContent: pass
     class EmbeddedResource: pass
     class LoggingLevel: pass
+
+# Optional fast JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from dotenv import load_dotenv
 
 sys.path.append(str(Path(__file__).parent.parent))
+from propellerads import __version__
 from propellerads.client import PropellerAdsClient as PropellerAdsUltimateClient
+from propellerads.utils.cache import TTLCache
 # Optional AI interface import
 try:
-    from src.ai_interface import PropellerAdsAIInterface
+    from propellerads.ai_interface import PropellerAdsAIInterface
 except ImportError:
     # AI interface not available - create dummy class
     class PropellerAdsAIInterface:
@@ -66,10 +91,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Read-only tool results are served from cache for this many seconds
+READ_CACHE_TTL = 30
+# Targeting collections (countries, OS, browsers) change rarely
+TARGETING_CACHE_TTL = 3600
+
+# Resource sources served over MCP
+DOCS_PATH = Path(__file__).parent.parent / "docs" / "ai-agents"
+PATTERNS_PATH = Path(__file__).parent.parent / "docs" / "metadata" / "tasks.yaml"
+
+# Built documentation bundles persist here across restarts
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "propellerads-mcp"
+
+# Worker threads available to blocking client calls
+EXECUTOR_MAX_WORKERS = 32
+
+# Tools that may change account state - never coalesced or cached
+WRITE_TOOLS = frozenset({
+    "create_campaign",
+    "update_campaign",
+    "execute_natural_language_command"
+})
+
+# YYYY-MM-DD, shared by the tool schemas and argument pre-validation
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+_DATE_RE = re.compile(DATE_PATTERN)
+DATE_ARGUMENTS = ("date_from", "date_to")
+
+# Tool status filter -> API campaign status codes
+STATUS_MAP: Mapping[str, FrozenSet[int]] = MappingProxyType({
+    "active": frozenset({6}),   # working
+    "paused": frozenset({7}),   # paused
+    "stopped": frozenset({8}),  # stopped
+    "draft": frozenset({1})     # draft
+})
+
+
+def _dump_result(result: Any) -> str:
+    """Serialize a tool result as indented JSON"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                result,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # e.g. integers outside 64-bit range - fall back to stdlib
+            pass
+    return json.dumps(result, indent=2, default=str)
+
+
+def _format_result(result: Any) -> str:
+    """Render a tool result as the text of its single TextContent frame"""
+    if isinstance(result, dict) and "error" in result:
+        return f"❌ Error: {result['error']}"
+    return _dump_result(result)
+
+
+def _cache_dir() -> Path:
+    """Directory for persisted documentation bundles (PROPELLERADS_MCP_CACHE_DIR overrides)"""
+    return Path(os.getenv("PROPELLERADS_MCP_CACHE_DIR", DEFAULT_CACHE_DIR))
+
+
+def _check_dates(arguments: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return an error message if a date argument is not YYYY-MM-DD"""
+    if not arguments:
+        return None
+    for key in DATE_ARGUMENTS:
+        value = arguments.get(key)
+        if value is not None and not (isinstance(value, str) and _DATE_RE.fullmatch(value)):
+            return f"Invalid {key}: expected YYYY-MM-DD, got {value!r}"
+    return None
+
 
 class PropellerAdsMCPServer:
     """Enterprise MCP Server for PropellerAds API integration"""
     
+    __slots__ = (
+        "api_token",
+        "server",
+        "_client",
+        "_ai_interface",
+        "_read_cache",
+        "_inflight",
+        "_doc_cache",
+        "_doc_key",
+        "_patterns_cache",
+        "_patterns_mtime",
+        "_handlers",
+    )
+    
     def __init__(self):
         """Initialize the MCP server with enterprise client"""
         # Get API token from environment
@@ -83,20 +195,57 @@ class PropellerAdsMCPServer:
         # Initialize server
         self.server = Server("propellerads-enterprise-mcp")
         
-        # Initialize our enhanced client
-        from propellerads.client_enhanced import EnhancedPropellerAdsClient
-        self.client = EnhancedPropellerAdsClient(self.api_token)
+        # Client and AI interface are created on first use
+        self._client = None
+        self._ai_interface = None
+        
+        # Cache for read-only tool results
+        self._read_cache = TTLCache(ttl=READ_CACHE_TTL, maxsize=256)
         
-        # Initialize AI interface
-        self.ai_interface = PropellerAdsAIInterface(self.client)
+        # In-flight read tool calls, keyed by tool name and arguments
+        self._inflight: Dict[tuple, asyncio.Future] = {}
         
-        # Track operations for safety
-        self.pending_operations = {}
+        # Resource contents, rebuilt only when the source files change
+        self._doc_cache: Optional[str] = None
+        self._doc_key: tuple = (0, 0.0)
+        self._patterns_cache: Optional[str] = None
+        self._patterns_mtime: float = 0.0
+        
+        # Tool name -> handler dispatch table
+        self._handlers: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+            "get_account_balance": self._handle_get_balance,
+            "health_check": self._handle_health_check,
+            "list_campaigns": self._handle_list_campaigns,
+            "get_campaign_details": self._handle_get_campaign_details,
+            "create_campaign": self._handle_create_campaign,
+            "update_campaign": self._handle_update_campaign,
+            "get_campaign_statistics": self._handle_get_statistics,
+            "get_performance_summary": self._handle_performance_summary,
+            "analyze_campaign_performance": self._handle_analyze_performance,
+            "get_optimization_recommendations": self._handle_optimization_recommendations,
+            "get_targeting_options": self._handle_targeting_options,
+            "execute_natural_language_command": self._handle_natural_language,
+        }
         
         # Register handlers
         self._register_tools()
         self._register_resources()
     
+    @property
+    def client(self):
+        """Enhanced API client, created on first use"""
+        if self._client is None:
+            from propellerads.client_enhanced import EnhancedPropellerAdsClient
+            self._client = EnhancedPropellerAdsClient(self.api_token)
+        return self._client
+    
+    @property
+    def ai_interface(self):
+        """AI interface, created on first use"""
+        if self._ai_interface is None:
+            self._ai_interface = PropellerAdsAIInterface(self.client)
+        return self._ai_interface
+    
     def _register_tools(self):
         """Register all available tools"""
         
@@ -248,12 +397,12 @@ class PropellerAdsMCPServer:
                             "date_from": {
                                 "type": "string",
                                 "description": "Start date (YYYY-MM-DD format)",
-                                "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
+                                "pattern": DATE_PATTERN
                             },
                             "date_to": {
                                 "type": "string",
                                 "description": "End date (YYYY-MM-DD format)",
-                                "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
+                                "pattern": DATE_PATTERN
                             },
                             "group_by": {
                                 "type": "string",
@@ -372,44 +521,24 @@ class PropellerAdsMCPServer:
         async def call_tool(name: str, arguments: Dict[str, Any]) -> Sequence[TextContent]:
             """Handle tool calls"""
             try:
-                logger.info(f"Tool called: {name} with arguments: {arguments}")
+                logger.info("Tool called: %s with arguments: %r", name, arguments)
                 
                 # Route to appropriate handler
-                if name == "get_account_balance":
-                    result = await self._handle_get_balance()
-                elif name == "health_check":
-                    result = await self._handle_health_check()
-                elif name == "list_campaigns":
-                    result = await self._handle_list_campaigns(**arguments)
-                elif name == "get_campaign_details":
-                    result = await self._handle_get_campaign_details(**arguments)
-                elif name == "create_campaign":
-                    result = await self._handle_create_campaign(**arguments)
-                elif name == "update_campaign":
-                    result = await self._handle_update_campaign(**arguments)
-                elif name == "get_campaign_statistics":
-                    result = await self._handle_get_statistics(**arguments)
-                elif name == "get_performance_summary":
-                    result = await self._handle_performance_summary(**arguments)
-                elif name == "analyze_campaign_performance":
-                    result = await self._handle_analyze_performance(**arguments)
-                elif name == "get_optimization_recommendations":
-                    result = await self._handle_optimization_recommendations(**arguments)
-                elif name == "get_targeting_options":
-                    result = await self._handle_targeting_options(**arguments)
-                elif name == "execute_natural_language_command":
-                    result = await self._handle_natural_language(**arguments)
-                else:
+                handler = self._handlers.get(name)
+                if handler is None:
                     result = {"error": f"Unknown tool: {name}"}
-                
-                # Format response
-                if isinstance(result, dict) and "error" in result:
-                    return [TextContent(type="text", text=f"❌ Error: {result['error']}")]
+                elif (date_error := _check_dates(arguments)) is not None:
+                    result = {"error": date_error}
+                elif name in WRITE_TOOLS:
+                    result = await handler(**(arguments or {}))
                 else:
-                    return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+                    result = await self._call_single_flight(name, handler, arguments or {})
+                
+                # Format response as one JSON document
+                return [TextContent(type="text", text=_format_result(result))]
                     
             except Exception as e:
-                logger.error(f"Tool execution error: {e}")
+                logger.error("Tool execution error: %s", e)
                 return [TextContent(type="text", text=f"❌ Tool execution failed: {str(e)}")]
     
     def _register_resources(self):
@@ -438,31 +567,124 @@ class PropellerAdsMCPServer:
             """Read resource content"""
             if uri == "propellerads://documentation":
                 # Return our comprehensive documentation
-                docs_path = Path(__file__).parent.parent / "docs" / "ai-agents"
-                if docs_path.exists():
-                    content = "# PropellerAds Enterprise API Documentation\\n\\n"
-                    for doc_file in docs_path.rglob("*.md"):
-                        content += f"## {doc_file.name}\\n\\n"
-                        content += doc_file.read_text() + "\\n\\n"
-                    return content
-                else:
-                    return "Documentation not found"
+                return await asyncio.to_thread(self._load_documentation)
             elif uri == "propellerads://ai-patterns":
                 # Return AI task patterns
-                patterns_path = Path(__file__).parent.parent / "docs" / "metadata" / "tasks.yaml"
-                if patterns_path.exists():
-                    return patterns_path.read_text()
-                else:
-                    return "{}"
+                return await asyncio.to_thread(self._load_ai_patterns)
             else:
                 raise ValueError(f"Unknown resource: {uri}")
     
+    def _load_documentation(self) -> str:
+        """Load documentation bundle, reusing the cached copy while files are unchanged"""
+        if not DOCS_PATH.exists():
+            return "Documentation not found"
+        
+        doc_files = list(DOCS_PATH.rglob("*.md"))
+        doc_key = (len(doc_files), max((f.stat().st_mtime for f in doc_files), default=0.0))
+        if self._doc_cache is not None and doc_key == self._doc_key:
+            return self._doc_cache
+        
+        content = self._read_documentation_bundle(doc_files)
+        
+        self._doc_cache = content
+        self._doc_key = doc_key
+        return content
+    
+    def _read_documentation_bundle(self, doc_files: List[Path]) -> str:
+        """Build the documentation bundle, reusing a persisted copy across restarts"""
+        digest = hashlib.blake2b(digest_size=16)
+        for doc_file in doc_files:
+            stat = doc_file.stat()
+            digest.update(f"{doc_file}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        cache_dir = _cache_dir()
+        cache_file = cache_dir / f"docs-{__version__}-{digest.hexdigest()}.md"
+        
+        try:
+            return cache_file.read_text()
+        except OSError:
+            pass
+        
+        parts = ["# PropellerAds Enterprise API Documentation\n\n"]
+        for doc_file in doc_files:
+            parts.append(f"## {doc_file.name}\n\n")
+            parts.append(doc_file.read_text())
+            parts.append("\n\n")
+        content = "".join(parts)
+        
+        # Write atomically so a concurrent server never reads a partial bundle
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(content)
+            os.replace(tmp_file, cache_file)
+            
+            # Only the latest bundle is kept
+            for stale_file in cache_dir.glob("docs-*.md"):
+                if stale_file != cache_file:
+                    stale_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Could not persist documentation cache: %s", e)
+        
+        return content
+    
+    def _load_ai_patterns(self) -> str:
+        """Load AI task patterns, reusing the cached copy while the file is unchanged"""
+        if not PATTERNS_PATH.exists():
+            return "{}"
+        
+        mtime = PATTERNS_PATH.stat().st_mtime
+        if self._patterns_cache is not None and mtime == self._patterns_mtime:
+            return self._patterns_cache
+        
+        self._patterns_cache = PATTERNS_PATH.read_text()
+        self._patterns_mtime = mtime
+        return self._patterns_cache
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        self.close()
+    
+    def close(self):
+        """Close the underlying client and its pooled connections"""
+        if self._client is not None:
+            self._client.close()
+    
+    def bust_cache(self):
+        """Drop cached read results so the next read reflects recent writes"""
+        self._read_cache.clear()
+    
+    async def _call_single_flight(
+        self,
+        name: str,
+        handler: Callable[..., Awaitable[Dict[str, Any]]],
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run a read handler, sharing one upstream call among identical concurrent requests"""
+        key = (name, json.dumps(arguments, sort_keys=True, default=str))
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(handler(**arguments))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(future)
+    
     # Tool handlers
-    async def _handle_get_balance(self) -> Dict[str, Any]:
+    async def _handle_get_balance(self, **_) -> Dict[str, Any]:
         """Handle balance request"""
+        cached = self._read_cache.get(("balance",))
+        if cached is not None:
+            return cached
+        
         try:
-            balance = self.client.balance.get_balance()
-            return {
+            balance = await asyncio.to_thread(self.client.balance.get_balance)
+            result = {
                 "balance": balance.formatted if hasattr(balance, 'formatted') else str(balance),
                 "raw_amount": balance.amount if hasattr(balance, 'amount') else balance,
                 "currency": "USD",
@@ -470,23 +692,33 @@ class PropellerAdsMCPServer:
             }
         except Exception as e:
             return {"error": str(e)}
+        
+        self._read_cache.set(("balance",), result)
+        return result
     
-    async def _handle_health_check(self) -> Dict[str, Any]:
+    async def _handle_health_check(self, **_) -> Dict[str, Any]:
         """Handle health check"""
+        cached = self._read_cache.get(("health",))
+        if cached is not None:
+            return cached
+        
         try:
-            health = self.client.health_check()
-            return {
+            health = await asyncio.to_thread(self.client.health_check)
+            result = {
                 "status": "healthy" if health else "unhealthy",
                 "api_accessible": health,
-                "timestamp": str(asyncio.get_event_loop().time())
+                "timestamp": str(time.time())
             }
         except Exception as e:
             return {"error": str(e)}
+        
+        self._read_cache.set(("health",), result)
+        return result
     
     async def _handle_list_campaigns(self, status: str = "all", limit: int = 100) -> Dict[str, Any]:
         """Handle campaigns list request"""
         try:
-            campaigns = self.client.campaigns.get_campaigns(limit=limit)
+            campaigns = await asyncio.to_thread(self.client.campaigns.get_campaigns, limit=limit)
             
             # Handle different response formats
             if isinstance(campaigns, dict) and 'result' in campaigns:
@@ -494,16 +726,14 @@ class PropellerAdsMCPServer:
             else:
                 campaigns_list = campaigns
             
-            # Filter by status if specified
+            # Filter by status if specified, stopping once limit matches are found
             if status != "all" and isinstance(campaigns_list, list):
-                status_map = {
-                    "active": [6],  # working
-                    "paused": [7],  # paused
-                    "stopped": [8], # stopped
-                    "draft": [1]    # draft
-                }
-                if status in status_map:
-                    campaigns_list = [c for c in campaigns_list if c.get('status') in status_map[status]]
+                target_statuses = STATUS_MAP.get(status)
+                if target_statuses is not None:
+                    campaigns_list = list(islice(
+                        (c for c in campaigns_list if c.get('status') in target_statuses),
+                        limit
+                    ))
             
             return {
                 "campaigns": campaigns_list,
@@ -517,7 +747,9 @@ class PropellerAdsMCPServer:
     async def _handle_get_campaign_details(self, campaign_id: int) -> Dict[str, Any]:
         """Handle campaign details request"""
         try:
-            response = self.client._make_request('GET', f'/adv/campaigns/{campaign_id}')
+            response = await asyncio.to_thread(
+                self.client._make_request, 'GET', f'/adv/campaigns/{campaign_id}'
+            )
             campaign = response.json()
             return {
                 "campaign": campaign,
@@ -530,7 +762,10 @@ class PropellerAdsMCPServer:
         """Handle campaign creation (requires confirmation)"""
         try:
             # This is a write operation - in real MCP, this would trigger confirmation
-            logger.warning(f"WRITE OPERATION: Creating campaign with params: {kwargs}")
+            logger.warning("WRITE OPERATION: Creating campaign with params: %r", kwargs)
+            
+            # Writes invalidate cached reads
+            self.bust_cache()
             
             # For now, return what would be created (dry run)
             return {
@@ -546,7 +781,10 @@ class PropellerAdsMCPServer:
         """Handle campaign update (requires confirmation)"""
         try:
             # This is a write operation - in real MCP, this would trigger confirmation
-            logger.warning(f"WRITE OPERATION: Updating campaign with params: {kwargs}")
+            logger.warning("WRITE OPERATION: Updating campaign with params: %r", kwargs)
+            
+            # Writes invalidate cached reads
+            self.bust_cache()
             
             return {
                 "operation": "update_campaign",
@@ -561,7 +799,7 @@ class PropellerAdsMCPServer:
         """Handle statistics request"""
         try:
             # Use enhanced client statistics API
-            stats = self.client.statistics.get_statistics(**kwargs)
+            stats = await asyncio.to_thread(self.client.statistics.get_statistics, **kwargs)
             return {
                 "statistics": stats,
                 "parameters": kwargs
@@ -572,7 +810,7 @@ class PropellerAdsMCPServer:
     async def _handle_performance_summary(self, days: int = 7) -> Dict[str, Any]:
         """Handle performance summary"""
         try:
-            summary = self.ai_interface.get_performance_summary(days=days)
+            summary = await asyncio.to_thread(self.ai_interface.get_performance_summary, days=days)
             return {
                 "summary": summary,
                 "period_days": days
@@ -583,7 +821,9 @@ class PropellerAdsMCPServer:
     async def _handle_analyze_performance(self, campaign_id: int, analysis_type: str = "performance") -> Dict[str, Any]:
         """Handle AI performance analysis"""
         try:
-            analysis = self.ai_interface.analyze_campaign_performance(campaign_id, analysis_type)
+            analysis = await asyncio.to_thread(
+                self.ai_interface.analyze_campaign_performance, campaign_id, analysis_type
+            )
             return {
                 "analysis": analysis,
                 "campaign_id": campaign_id,
@@ -595,7 +835,9 @@ class PropellerAdsMCPServer:
     async def _handle_optimization_recommendations(self, **kwargs) -> Dict[str, Any]:
         """Handle optimization recommendations"""
         try:
-            recommendations = self.ai_interface.get_optimization_recommendations(**kwargs)
+            recommendations = await asyncio.to_thread(
+                self.ai_interface.get_optimization_recommendations, **kwargs
+            )
             return {
                 "recommendations": recommendations,
                 "parameters": kwargs
@@ -605,23 +847,28 @@ class PropellerAdsMCPServer:
     
     async def _handle_targeting_options(self, option_type: str = "all") -> Dict[str, Any]:
         """Handle targeting options request"""
-        try:
-            # Use enhanced client collections API
-            options = self.client.collections.get_targeting_options()
+        # The full tree is cached once and sliced per option type
+        options = self._read_cache.get(("targeting_options",))
+        if options is None:
+            try:
+                # Use enhanced client collections API
+                options = await asyncio.to_thread(self.client.collections.get_targeting_options)
+            except Exception as e:
+                return {"error": str(e)}
             
-            if option_type != "all" and option_type in options:
-                return {option_type: options[option_type]}
-            else:
-                return options
-        except Exception as e:
-            return {"error": str(e)}
+            self._read_cache.set(("targeting_options",), options, ttl=TARGETING_CACHE_TTL)
+        
+        if option_type != "all" and option_type in options:
+            return {option_type: options[option_type]}
+        return options
     
     async def _handle_natural_language(self, command: str, confirm_write_operations: bool = True) -> Dict[str, Any]:
         """Handle natural language commands"""
         try:
             # Use AI interface to process natural language
-            result = self.ai_interface.process_natural_language_command(
-                command, 
+            result = await asyncio.to_thread(
+                self.ai_interface.process_natural_language_command,
+                command,
                 confirm_write_operations=confirm_write_operations
             )
             return {
@@ -638,6 +885,11 @@ class PropellerAdsMCPServer:
             logger.error("MCP package not available. Install with: pip install mcp")
             return
             
+        # Blocking client calls run in the default executor
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS)
+        )
+        
         logger.info("Starting PropellerAds Enterprise MCP Server...")
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             await self.server.run(
@@ -650,12 +902,15 @@ class PropellerAdsMCPServer:
 async def main():
     """Main entry point"""
     try:
-        server = PropellerAdsMCPServer()
-        await server.run()
+        async with PropellerAdsMCPServer() as server:
+            await server.run()
     except Exception as e:
-        logger.error(f"Server startup failed: {e}")
+        logger.error("Server startup failed: %s", e)
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop lowers per-message overhead of the stdio JSON-RPC loop
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
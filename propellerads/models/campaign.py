@@ -12,6 +12,9 @@ from enum import Enum
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+_DATE_FIELDS = ('created_at', 'updated_at', 'started_at', 'expires_at')
+
+
 class CampaignStatus(str, Enum):
     """Campaign status enumeration."""
     ACTIVE = "active"
@@ -87,7 +90,7 @@ class Campaign(BaseModel):
     
     @field_validator('name')
     @classmethod
-    def validate_name(cls, v):
+    def validate_name(cls, v: str) -> str:
         """Validate campaign name."""
         if not v or not v.strip():
             raise ValueError('Campaign name cannot be empty')
@@ -95,7 +98,7 @@ class Campaign(BaseModel):
     
     @field_validator('target_url', 'tracking_url')
     @classmethod
-    def validate_urls(cls, v):
+    def validate_urls(cls, v: Optional[str]) -> Optional[str]:
         """Validate URLs."""
         if v and not (v.startswith('http://') or v.startswith('https://')):
             raise ValueError('URL must start with http:// or https://')
@@ -103,16 +106,14 @@ class Campaign(BaseModel):
     
     @field_validator('countries')
     @classmethod
-    def validate_countries(cls, v):
+    def validate_countries(cls, v: Optional[List[str]]) -> Optional[List[str]]:
         """Validate country codes."""
-        if v:
-            for country in v:
-                if not isinstance(country, str) or len(country) != 2:
-                    raise ValueError('Country codes must be 2-letter ISO codes')
+        if v and not all(len(country) == 2 for country in v):
+            raise ValueError('Country codes must be 2-letter ISO codes')
         return v
     
     @model_validator(mode='after')
-    def validate_dates(self):
+    def validate_dates(self) -> 'Campaign':
         """Validate date relationships."""
         if self.started_at and self.expires_at and self.started_at >= self.expires_at:
             raise ValueError('Campaign start time must be before expiration time')
@@ -121,20 +122,15 @@ class Campaign(BaseModel):
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> 'Campaign':
         """Create Campaign instance from API response."""
-        # Handle different date formats
-        date_fields = ['created_at', 'updated_at', 'started_at', 'expires_at']
-        for field in date_fields:
-            if field in data and data[field]:
-                if isinstance(data[field], str):
-                    try:
-                        for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d']:
-                            try:
-                                data[field] = datetime.strptime(data[field], fmt)
-                                break
-                            except ValueError:
-                                continue
-                    except:
-                        data[field] = None
+        # Handle different date formats ('YYYY-MM-DD HH:MM:SS', 'YYYY-MM-DDTHH:MM:SS',
+        # 'YYYY-MM-DD'); fromisoformat parses all of them in a single C call
+        for field in _DATE_FIELDS:
+            value = data.get(field)
+            if value and isinstance(value, str):
+                try:
+                    data[field] = datetime.fromisoformat(value)
+                except ValueError:
+                    pass
         
         # Handle nested traffic source
         if 'traffic_source' in data and isinstance(data['traffic_source'], dict):
@@ -190,7 +186,7 @@ class CampaignCreate(BaseModel):
     
     @field_validator('name')
     @classmethod
-    def validate_name(cls, v):
+    def validate_name(cls, v: str) -> str:
         if not v or not v.strip():
             raise ValueError('Campaign name is required')
         return v.strip()
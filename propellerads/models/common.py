@@ -4,7 +4,7 @@ PropellerAds Common Models
 Shared Pydantic models for common API responses and requests.
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Literal, Union
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
@@ -12,6 +12,12 @@ from enum import Enum
 from pydantic import BaseModel, Field, field_validator
 
 
+_ALLOWED_GROUP_BY = frozenset({
+    'campaign_id', 'day', 'hour', 'country', 'zone', 'os', 'browser',
+    'device_type', 'connection_type', 'carrier'
+})
+
+
 class BalanceResponse(BaseModel):
     """Account balance response model."""
     
@@ -39,16 +45,13 @@ class StatisticsRequest(BaseModel):
     
     @field_validator('group_by')
     @classmethod
-    def validate_group_by(cls, v):
+    def validate_group_by(cls, v: List[str]) -> List[str]:
         """Validate grouping fields."""
-        allowed_fields = [
-            'campaign_id', 'day', 'hour', 'country', 'zone', 'os', 'browser',
-            'device_type', 'connection_type', 'carrier'
-        ]
-        
         for field in v:
-            if field not in allowed_fields:
-                raise ValueError(f"Invalid group_by field: {field}. Allowed: {allowed_fields}")
+            if field not in _ALLOWED_GROUP_BY:
+                raise ValueError(
+                    f"Invalid group_by field: {field}. Allowed: {sorted(_ALLOWED_GROUP_BY)}"
+                )
         
         return v
 
@@ -82,6 +85,7 @@ class StatisticsRow(BaseModel):
     cpa: Optional[Decimal] = None
     
     model_config = {
+        "frozen": True,
         "json_encoders": {
             Decimal: lambda v: float(v) if v else None
         }
@@ -100,7 +104,7 @@ class ApiError(BaseModel):
 class HealthCheckResponse(BaseModel):
     """Health check response model."""
     
-    status: str = Field(..., pattern=r'^(healthy|unhealthy|degraded)$')
+    status: Literal['healthy', 'unhealthy', 'degraded']
     timestamp: datetime
     api_version: str = Field(default="v5")
     response_time: Optional[float] = None
@@ -65,13 +65,6 @@ class CampaignRates(PropellerBaseSchema):
     """Campaign rate configuration"""
     amount: Decimal = Field(description="Rate amount")
     countries: List[str] = Field(description="Country codes for this rate")
-    
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v):
-        if isinstance(v, (int, float)):
-            return Decimal(str(v))
-        return v
 
 
 class CampaignAudience(PropellerBaseSchema):
@@ -160,13 +153,6 @@ class Campaign(PropellerBaseSchema, IDMixin, TimestampMixin):
             if '${SUBID}' not in v:
                 raise ValueError('CPA & SCPA rate models must have ${SUBID} macro')
         return v
-    
-    @field_validator('daily_amount', 'total_amount', 'cpa_goal_bid', 'cpa_goal_slice_budget')
-    @classmethod
-    def validate_decimal_fields(cls, v):
-        if v is not None and isinstance(v, (int, float)):
-            return Decimal(str(v))
-        return v
 
 
 class CampaignFilters(PropellerBaseSchema):
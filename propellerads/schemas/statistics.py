@@ -2,8 +2,8 @@
 Statistics schemas for PropellerAds API
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import Field
+from typing import List, Literal, Optional, Dict, Any
+from pydantic import ConfigDict, Field
 from decimal import Decimal
 from datetime import datetime, date
 
@@ -33,12 +33,15 @@ class StatisticsFilters(PropellerBaseSchema):
     
     # Sorting
     order_by: Optional[str] = Field(default="date", description="Sort field")
-    order_direction: Optional[str] = Field(default="desc", pattern="^(asc|desc)$")
+    order_direction: Optional[Literal["asc", "desc"]] = "desc"
 
 
 class StatisticsRow(PropellerBaseSchema):
     """Single statistics row"""
     
+    # Rows are read-only API data; skip per-assignment validation
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+    
     # Identifiers
     campaign_id: Optional[int] = None
     campaign_name: Optional[str] = None
@@ -74,6 +77,14 @@ class StatisticsRow(PropellerBaseSchema):
     session_duration: Optional[int] = None  # in seconds
 
 
+class StatisticsPage(PropellerBaseSchema):
+    """Raw /adv/statistics response body"""
+    
+    data: List[StatisticsRow] = Field(default_factory=list)
+    summary: Optional[StatisticsRow] = None
+    total: Optional[int] = None
+
+
 class Statistics(PropellerBaseSchema):
     """Statistics response"""
     
@@ -0,0 +1,40 @@
+"""
+Micro-batching helpers for the PropellerAds SDK.
+
+Requests queued by concurrent callers are drained in short time windows, so
+they can be sent upstream together.
+"""
+
+import asyncio
+from typing import Any, List
+
+
+async def next_batch(queue: asyncio.Queue, window: float, max_size: int) -> List[Any]:
+    """
+    Wait for the next queued item and collect the ones that follow it.
+
+    Items are collected until ``window`` seconds have passed since the first
+    one arrived or ``max_size`` items are in the batch.
+
+    Args:
+        queue: Queue to drain
+        window: Seconds to keep collecting after the first item
+        max_size: Maximum number of items in one batch
+
+    Returns:
+        Items in arrival order
+    """
+    loop = asyncio.get_running_loop()
+    batch = [await queue.get()]
+    deadline = loop.time() + window
+
+    while len(batch) < max_size:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+
+    return batch
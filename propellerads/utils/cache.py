@@ -0,0 +1,124 @@
+"""
+TTL Cache Utility
+
+Small in-memory cache with per-entry expiry for read-mostly API data.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with time-to-live expiry.
+
+    Entries expire ``ttl`` seconds after they are stored. When the cache
+    grows beyond ``maxsize`` the oldest entry is evicted first.
+
+    Example:
+        >>> cache = TTLCache(ttl=30, maxsize=256)
+        >>> cache.set(("balance",), {"amount": 100})
+        >>> cache.get(("balance",))
+        {'amount': 100}
+    """
+
+    def __init__(self, ttl: float = 60, maxsize: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Default time-to-live in seconds
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        # key -> (expires_at, value)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on miss or expiry
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live override in seconds
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """Remove a single entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and time.monotonic() < entry[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get cache status.
+
+        Returns:
+            Dict: Cache statistics
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
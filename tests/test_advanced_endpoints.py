@@ -5,31 +5,258 @@ Comprehensive testing of advanced API endpoints and features.
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from propellerads.client import PropellerAdsClient
-from propellerads.exceptions import PropellerAdsError
+import requests
+from collections import deque
+from types import SimpleNamespace
+
+# Pure-mock tests with worker-local patching: safe to run under `pytest -n auto --dist loadgroup`
+pytestmark = pytest.mark.xdist_group("mock_only")
+
+
+# Canned API responses, built once and only read by the tests
+CREATED_CAMPAIGN_PAYLOAD = {
+    "id": 12345,
+    "name": "Advanced Campaign",
+    "status": "active",
+    "targeting": {
+        "countries": ["US", "CA"],
+        "devices": ["desktop", "mobile"]
+    }
+}
+
+STATUS_TRANSITION_PAYLOAD = {
+    "id": 12345,
+    "status": "paused",
+    "previous_status": "active"
+}
+
+CREATIVE_PAYLOAD = {
+    "id": 67890,
+    "name": "Test Creative",
+    "type": "banner",
+    "status": "pending_review",
+    "dimensions": {"width": 728, "height": 90}
+}
+
+CREATIVE_FORMATS_PAYLOAD = [
+    {"id": 1, "name": "Banner 728x90", "type": "banner"},
+    {"id": 2, "name": "Video 16:9", "type": "video"},
+    {"id": 3, "name": "Native Ad", "type": "native"}
+]
+
+CREATIVE_STATS_PAYLOAD = {
+    "creative_id": 67890,
+    "impressions": 10000,
+    "clicks": 250,
+    "ctr": 2.5,
+    "conversions": 15,
+    "cost": 125.50
+}
+
+GEO_TARGETING_PAYLOAD = {
+    "countries": [
+        {"code": "US", "name": "United States", "available": True},
+        {"code": "CA", "name": "Canada", "available": True},
+        {"code": "GB", "name": "United Kingdom", "available": True}
+    ],
+    "regions": [
+        {"id": 1, "name": "North America", "countries": ["US", "CA"]},
+        {"id": 2, "name": "Europe", "countries": ["GB", "DE", "FR"]}
+    ]
+}
+
+DEVICE_TARGETING_PAYLOAD = {
+    "devices": [
+        {"type": "desktop", "available": True},
+        {"type": "mobile", "available": True},
+        {"type": "tablet", "available": True}
+    ],
+    "operating_systems": [
+        {"name": "Windows", "versions": ["10", "11"]},
+        {"name": "Android", "versions": ["11", "12", "13"]},
+        {"name": "iOS", "versions": ["15", "16", "17"]}
+    ]
+}
+
+AUDIENCE_TARGETING_PAYLOAD = {
+    "demographics": {
+        "age_groups": ["18-24", "25-34", "35-44", "45-54", "55+"],
+        "genders": ["male", "female", "other"]
+    },
+    "interests": [
+        {"id": 1, "name": "Technology", "subcategories": ["Software", "Hardware"]},
+        {"id": 2, "name": "Sports", "subcategories": ["Football", "Basketball"]}
+    ]
+}
+
+CAMPAIGN_STATS_PAYLOAD = {
+    "campaign_id": 12345,
+    "date_range": {"from": "2023-01-01", "to": "2023-01-31"},
+    "metrics": {
+        "impressions": 100000,
+        "clicks": 2500,
+        "conversions": 125,
+        "cost": 1250.00,
+        "revenue": 2500.00,
+        "profit": 1250.00,
+        "roi": 100.0
+    },
+    "breakdown": {
+        "by_day": [
+            {"date": "2023-01-01", "impressions": 3000, "clicks": 75},
+            {"date": "2023-01-02", "impressions": 3200, "clicks": 80}
+        ],
+        "by_country": [
+            {"country": "US", "impressions": 60000, "clicks": 1500},
+            {"country": "CA", "impressions": 40000, "clicks": 1000}
+        ]
+    }
+}
+
+REAL_TIME_STATS_PAYLOAD = {
+    "timestamp": "2023-01-15T10:30:00Z",
+    "live_campaigns": 5,
+    "active_impressions": 1500,
+    "current_spend": 45.75,
+    "hourly_metrics": {
+        "impressions": 500,
+        "clicks": 12,
+        "cost": 15.25
+    }
+}
+
+ZONES_PAYLOAD = [
+    {
+        "id": 1001,
+        "name": "Premium Desktop",
+        "type": "display",
+        "formats": ["728x90", "300x250", "160x600"],
+        "countries": ["US", "CA", "GB"],
+        "pricing": {"cpm": 2.50, "cpc": 0.25}
+    },
+    {
+        "id": 1002,
+        "name": "Mobile Push",
+        "type": "push",
+        "formats": ["push_notification"],
+        "countries": ["US", "CA"],
+        "pricing": {"cpm": 1.80, "cpc": 0.18}
+    }
+]
+
+PROFILE_PAYLOAD = {
+    "id": 12345,
+    "email": "user@example.com",
+    "name": "Test User",
+    "account_type": "advertiser",
+    "status": "active",
+    "created_at": "2023-01-01T00:00:00Z",
+    "settings": {
+        "timezone": "UTC",
+        "currency": "USD",
+        "notifications": {
+            "email": True,
+            "push": False
+        }
+    }
+}
+
+INVOICES_PAYLOAD = {
+    "invoices": [
+        {
+            "id": "inv_001",
+            "amount": 1000.00,
+            "currency": "USD",
+            "status": "paid",
+            "date": "2023-01-01"
+        }
+    ],
+    "payments": [
+        {
+            "id": "pay_001",
+            "amount": 1000.00,
+            "method": "credit_card",
+            "status": "completed",
+            "date": "2023-01-01"
+        }
+    ]
+}
+
+NOTIFICATIONS_PAYLOAD = {
+    "notifications": [
+        {
+            "id": 1,
+            "type": "campaign_approved",
+            "message": "Your campaign has been approved",
+            "read": False,
+            "created_at": "2023-01-15T10:00:00Z"
+        },
+        {
+            "id": 2,
+            "type": "budget_alert",
+            "message": "Campaign budget 80% spent",
+            "read": True,
+            "created_at": "2023-01-14T15:30:00Z"
+        }
+    ],
+    "unread_count": 1
+}
+
+@pytest.fixture(scope="session")
+def client_cls():
+    """PropellerAdsClient, imported on first use instead of at collection time."""
+    from propellerads.client import PropellerAdsClient
+    return PropellerAdsClient
+
+
+@pytest.fixture(scope="module")
+def client(client_cls):
+    """Client shared by the tests in this module (HTTP goes to the fake transport)."""
+    client = client_cls(api_key="test-key")
+    yield client
+    client.close()
+
+
+def fake_resp(status=200, payload=None, text=""):
+    """Build a minimal response exposing only what the client reads."""
+    return SimpleNamespace(status_code=status, text=text, json=lambda: payload)
+
+
+class FakeTransport:
+    """Stands in for requests.Session.request and records each call."""
+    
+    def __init__(self):
+        self.calls = []
+        self.response = None
+        self.queued = deque()
+    
+    def set_response(self, status=200, payload=None, text=""):
+        """Set the response returned for subsequent requests."""
+        self.response = fake_resp(status, payload, text)
+    
+    def queue_responses(self, *specs):
+        """Queue (status, payload, text) responses, returned once each in order."""
+        self.queued.extend(fake_resp(*spec) for spec in specs)
+    
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.queued.popleft() if self.queued else self.response
+
+
+@pytest.fixture(autouse=True)
+def transport(monkeypatch):
+    """Route every session request in this module to a fake transport."""
+    fake = FakeTransport()
+    monkeypatch.setattr(requests.Session, "request", fake.request)
+    return fake
 
 
 class TestCampaignManagement:
     """Test advanced campaign management features."""
     
-    @patch('requests.Session.request')
-    def test_campaign_creation_with_targeting(self, mock_request):
+    def test_campaign_creation_with_targeting(self, client, transport):
         """Test campaign creation with targeting options."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "id": 12345,
-            "name": "Advanced Campaign",
-            "status": "active",
-            "targeting": {
-                "countries": ["US", "CA"],
-                "devices": ["desktop", "mobile"]
-            }
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(201, CREATED_CAMPAIGN_PAYLOAD)
         
         campaign_data = {
             "name": "Advanced Campaign",
@@ -48,39 +275,9 @@ class TestCampaignManagement:
         assert result["name"] == "Advanced Campaign"
         assert "targeting" in result
     
-    @patch('requests.Session.request')
-    def test_campaign_bulk_operations(self, mock_request):
-        """Test bulk campaign operations."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "updated": [12345, 12346, 12347],
-            "failed": [],
-            "total": 3
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        # Simulate bulk update
-        campaigns = client.get_campaigns()
-        
-        # Should handle bulk operations
-        assert mock_request.called
-    
-    @patch('requests.Session.request')
-    def test_campaign_status_transitions(self, mock_request):
+    def test_campaign_status_transitions(self, client, transport):
         """Test campaign status transitions."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": 12345,
-            "status": "paused",
-            "previous_status": "active"
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(200, STATUS_TRANSITION_PAYLOAD)
         
         # Test status update
         result = client.update_campaign(12345, {"status": "paused"})
@@ -92,21 +289,9 @@ class TestCampaignManagement:
 class TestCreativeManagement:
     """Test creative management endpoints."""
     
-    @patch('requests.Session.request')
-    def test_creative_upload_and_validation(self, mock_request):
+    def test_creative_upload_and_validation(self, client, transport):
         """Test creative upload and validation."""
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "id": 67890,
-            "name": "Test Creative",
-            "type": "banner",
-            "status": "pending_review",
-            "dimensions": {"width": 728, "height": 90}
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(201, CREATIVE_PAYLOAD)
         
         creative_data = {
             "name": "Test Creative",
@@ -121,43 +306,18 @@ class TestCreativeManagement:
         assert result["type"] == "banner"
         assert result["status"] == "pending_review"
     
-    @patch('requests.Session.request')
-    def test_creative_format_validation(self, mock_request):
+    def test_creative_format_validation(self, client, transport):
         """Test creative format validation."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {"id": 1, "name": "Banner 728x90", "type": "banner"},
-            {"id": 2, "name": "Video 16:9", "type": "video"},
-            {"id": 3, "name": "Native Ad", "type": "native"}
-        ]
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(200, CREATIVE_FORMATS_PAYLOAD)
         
         creatives = client.get_creatives()
         
         assert len(creatives) == 3
-        assert any(c["type"] == "banner" for c in creatives)
-        assert any(c["type"] == "video" for c in creatives)
-        assert any(c["type"] == "native" for c in creatives)
+        assert {"banner", "video", "native"} <= {c["type"] for c in creatives}
     
-    @patch('requests.Session.request')
-    def test_creative_performance_tracking(self, mock_request):
+    def test_creative_performance_tracking(self, client, transport):
         """Test creative performance tracking."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "creative_id": 67890,
-            "impressions": 10000,
-            "clicks": 250,
-            "ctr": 2.5,
-            "conversions": 15,
-            "cost": 125.50
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(200, CREATIVE_STATS_PAYLOAD)
         
         stats = client.get_creative_statistics(67890)
         
@@ -169,117 +329,27 @@ class TestCreativeManagement:
 class TestTargetingOptions:
     """Test targeting options and configurations."""
     
-    @patch('requests.Session.request')
-    def test_geographic_targeting(self, mock_request):
-        """Test geographic targeting options."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "countries": [
-                {"code": "US", "name": "United States", "available": True},
-                {"code": "CA", "name": "Canada", "available": True},
-                {"code": "GB", "name": "United Kingdom", "available": True}
-            ],
-            "regions": [
-                {"id": 1, "name": "North America", "countries": ["US", "CA"]},
-                {"id": 2, "name": "Europe", "countries": ["GB", "DE", "FR"]}
-            ]
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        targeting = client.get_targeting_options()
-        
-        assert "countries" in targeting
-        assert "regions" in targeting
-        assert len(targeting["countries"]) == 3
-    
-    @patch('requests.Session.request')
-    def test_device_targeting(self, mock_request):
-        """Test device targeting options."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "devices": [
-                {"type": "desktop", "available": True},
-                {"type": "mobile", "available": True},
-                {"type": "tablet", "available": True}
-            ],
-            "operating_systems": [
-                {"name": "Windows", "versions": ["10", "11"]},
-                {"name": "Android", "versions": ["11", "12", "13"]},
-                {"name": "iOS", "versions": ["15", "16", "17"]}
-            ]
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+    @pytest.mark.parametrize("payload,keys", [
+        (GEO_TARGETING_PAYLOAD, {"countries", "regions"}),
+        (DEVICE_TARGETING_PAYLOAD, {"devices", "operating_systems"}),
+        (AUDIENCE_TARGETING_PAYLOAD, {"demographics", "interests"}),
+    ], ids=["geographic", "device", "audience"])
+    def test_targeting_options(self, client, transport, payload, keys):
+        """Test geographic, device and audience targeting options."""
+        transport.set_response(200, payload)
         
         targeting = client.get_targeting_options()
         
-        assert "devices" in targeting
-        assert "operating_systems" in targeting
-    
-    @patch('requests.Session.request')
-    def test_audience_targeting(self, mock_request):
-        """Test audience targeting options."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "demographics": {
-                "age_groups": ["18-24", "25-34", "35-44", "45-54", "55+"],
-                "genders": ["male", "female", "other"]
-            },
-            "interests": [
-                {"id": 1, "name": "Technology", "subcategories": ["Software", "Hardware"]},
-                {"id": 2, "name": "Sports", "subcategories": ["Football", "Basketball"]}
-            ]
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        targeting = client.get_targeting_options()
-        
-        assert "demographics" in targeting
-        assert "interests" in targeting
+        assert keys <= targeting.keys()
+        assert targeting == payload
 
 
 class TestStatisticsAndReporting:
     """Test advanced statistics and reporting features."""
     
-    @patch('requests.Session.request')
-    def test_detailed_campaign_statistics(self, mock_request):
+    def test_detailed_campaign_statistics(self, client, transport):
         """Test detailed campaign statistics."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "campaign_id": 12345,
-            "date_range": {"from": "2023-01-01", "to": "2023-01-31"},
-            "metrics": {
-                "impressions": 100000,
-                "clicks": 2500,
-                "conversions": 125,
-                "cost": 1250.00,
-                "revenue": 2500.00,
-                "profit": 1250.00,
-                "roi": 100.0
-            },
-            "breakdown": {
-                "by_day": [
-                    {"date": "2023-01-01", "impressions": 3000, "clicks": 75},
-                    {"date": "2023-01-02", "impressions": 3200, "clicks": 80}
-                ],
-                "by_country": [
-                    {"country": "US", "impressions": 60000, "clicks": 1500},
-                    {"country": "CA", "impressions": 40000, "clicks": 1000}
-                ]
-            }
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(200, CAMPAIGN_STATS_PAYLOAD)
         
         stats = client.get_campaign_statistics(12345)
         
@@ -287,25 +357,9 @@ class TestStatisticsAndReporting:
         assert stats["metrics"]["roi"] == 100.0
         assert "breakdown" in stats
     
-    @patch('requests.Session.request')
-    def test_real_time_statistics(self, mock_request):
+    def test_real_time_statistics(self, client, transport):
         """Test real-time statistics."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "timestamp": "2023-01-15T10:30:00Z",
-            "live_campaigns": 5,
-            "active_impressions": 1500,
-            "current_spend": 45.75,
-            "hourly_metrics": {
-                "impressions": 500,
-                "clicks": 12,
-                "cost": 15.25
-            }
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(200, REAL_TIME_STATS_PAYLOAD)
         
         stats = client.get_statistics(
             date_from="2023-01-15 10:00:00",
@@ -314,275 +368,73 @@ class TestStatisticsAndReporting:
         
         assert "timestamp" in stats
         assert "live_campaigns" in stats
-    
-    @patch('requests.Session.request')
-    def test_custom_report_generation(self, mock_request):
-        """Test custom report generation."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "report_id": "rpt_123456",
-            "status": "completed",
-            "download_url": "https://reports.propellerads.com/download/rpt_123456",
-            "format": "csv",
-            "size": "2.5MB",
-            "generated_at": "2023-01-15T11:00:00Z"
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        # Simulate report generation request
-        campaigns = client.get_campaigns()
-        
-        # Should handle report generation
-        assert mock_request.called
 
 
 class TestZoneManagement:
     """Test zone management features."""
     
-    @patch('requests.Session.request')
-    def test_zone_configuration(self, mock_request):
+    def test_zone_configuration(self, client, transport):
         """Test zone configuration options."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "id": 1001,
-                "name": "Premium Desktop",
-                "type": "display",
-                "formats": ["728x90", "300x250", "160x600"],
-                "countries": ["US", "CA", "GB"],
-                "pricing": {"cpm": 2.50, "cpc": 0.25}
-            },
-            {
-                "id": 1002,
-                "name": "Mobile Push",
-                "type": "push",
-                "formats": ["push_notification"],
-                "countries": ["US", "CA"],
-                "pricing": {"cpm": 1.80, "cpc": 0.18}
-            }
-        ]
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
+        transport.set_response(200, ZONES_PAYLOAD)
         
         zones = client.get_zones()
         
         assert len(zones) == 2
         assert zones[0]["type"] == "display"
         assert zones[1]["type"] == "push"
-    
-    @patch('requests.Session.request')
-    def test_zone_performance_optimization(self, mock_request):
-        """Test zone performance optimization."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "zone_id": 1001,
-            "optimization_suggestions": [
-                {
-                    "type": "bid_adjustment",
-                    "recommendation": "increase_bid",
-                    "current_bid": 0.25,
-                    "suggested_bid": 0.30,
-                    "expected_improvement": "15% more impressions"
-                },
-                {
-                    "type": "targeting_adjustment",
-                    "recommendation": "expand_countries",
-                    "current_countries": ["US"],
-                    "suggested_countries": ["US", "CA", "GB"],
-                    "expected_improvement": "40% more volume"
-                }
-            ]
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        stats = client.get_zone_statistics(1001)
-        
-        # Should return zone statistics
-        assert mock_request.called
 
 
 class TestAccountManagement:
     """Test account management features."""
     
-    @patch('requests.Session.request')
-    def test_user_profile_management(self, mock_request):
-        """Test user profile management."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": 12345,
-            "email": "user@example.com",
-            "name": "Test User",
-            "account_type": "advertiser",
-            "status": "active",
-            "created_at": "2023-01-01T00:00:00Z",
-            "settings": {
-                "timezone": "UTC",
-                "currency": "USD",
-                "notifications": {
-                    "email": True,
-                    "push": False
-                }
-            }
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        profile = client.get_user_profile()
-        
-        assert profile["account_type"] == "advertiser"
-        assert profile["settings"]["currency"] == "USD"
-    
-    @patch('requests.Session.request')
-    def test_payment_and_billing(self, mock_request):
-        """Test payment and billing features."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "invoices": [
-                {
-                    "id": "inv_001",
-                    "amount": 1000.00,
-                    "currency": "USD",
-                    "status": "paid",
-                    "date": "2023-01-01"
-                }
-            ],
-            "payments": [
-                {
-                    "id": "pay_001",
-                    "amount": 1000.00,
-                    "method": "credit_card",
-                    "status": "completed",
-                    "date": "2023-01-01"
-                }
-            ]
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        invoices = client.get_user_invoices()
-        
-        assert len(invoices["invoices"]) == 1
-        assert invoices["invoices"][0]["status"] == "paid"
-    
-    @patch('requests.Session.request')
-    def test_notification_management(self, mock_request):
-        """Test notification management."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "notifications": [
-                {
-                    "id": 1,
-                    "type": "campaign_approved",
-                    "message": "Your campaign has been approved",
-                    "read": False,
-                    "created_at": "2023-01-15T10:00:00Z"
-                },
-                {
-                    "id": 2,
-                    "type": "budget_alert",
-                    "message": "Campaign budget 80% spent",
-                    "read": True,
-                    "created_at": "2023-01-14T15:30:00Z"
-                }
-            ],
-            "unread_count": 1
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        notifications = client.get_notifications()
-        
-        assert notifications["unread_count"] == 1
-        assert len(notifications["notifications"]) == 2
+    @pytest.mark.parametrize("method,payload,check", [
+        (
+            "get_user_profile", PROFILE_PAYLOAD,
+            lambda r: r["account_type"] == "advertiser" and r["settings"]["currency"] == "USD"
+        ),
+        (
+            "get_user_invoices", INVOICES_PAYLOAD,
+            lambda r: len(r["invoices"]) == 1 and r["invoices"][0]["status"] == "paid"
+        ),
+        (
+            "get_notifications", NOTIFICATIONS_PAYLOAD,
+            lambda r: r["unread_count"] == 1 and len(r["notifications"]) == 2
+        ),
+    ], ids=["profile", "billing", "notifications"])
+    def test_account_endpoints(self, client, transport, method, payload, check):
+        """Test user profile, billing and notification endpoints."""
+        transport.set_response(200, payload)
+        
+        result = getattr(client, method)()
+        
+        assert check(result)
 
 
 class TestAdvancedFeatures:
     """Test advanced SDK features."""
     
-    @patch('requests.Session.request')
-    def test_webhook_integration(self, mock_request):
-        """Test webhook integration features."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "webhook_url": "https://example.com/webhook",
-            "events": ["campaign_approved", "budget_alert", "conversion"],
-            "status": "active",
-            "last_delivery": "2023-01-15T10:00:00Z"
-        }
-        mock_request.return_value = mock_response
-        
-        client = PropellerAdsClient(api_key="test-key")
-        
-        # Simulate webhook configuration check
-        profile = client.get_user_profile()
-        
-        # Should handle webhook-related requests
-        assert mock_request.called
-    
-    @patch('requests.Session.request')
-    def test_api_rate_limit_handling(self, mock_request):
+    def test_api_rate_limit_handling(self, client, transport):
         """Test API rate limit handling."""
-        # First call succeeds
-        mock_response_success = Mock()
-        mock_response_success.status_code = 200
-        mock_response_success.text = '100.00'
-        
-        # Second call hits rate limit
-        mock_response_limit = Mock()
-        mock_response_limit.status_code = 429
-        mock_response_limit.text = 'Rate limit exceeded'
-        
-        mock_request.side_effect = [mock_response_success, mock_response_limit]
-        
-        client = PropellerAdsClient(api_key="test-key")
+        # First call succeeds, second call hits rate limit
+        transport.queue_responses((200, None, '100.00'), (429, None, 'Rate limit exceeded'))
         
-        # First call should succeed
         balance1 = client.get_balance()
         assert balance1 is not None
         
-        # Second call should handle rate limit
         try:
             balance2 = client.get_balance()
         except Exception:
             pass  # Expected due to rate limit
         
-        assert mock_request.call_count == 2
+        assert len(transport.calls) == 2
     
-    def test_configuration_flexibility(self):
+    @pytest.mark.parametrize("config", [
+        {"timeout": 60, "max_retries": 5, "rate_limit": 120},
+        {"timeout": 30, "max_retries": 3, "rate_limit": 60, "enable_metrics": False},
+    ])
+    def test_configuration_flexibility(self, client_cls, config):
         """Test configuration flexibility."""
-        # Test different configuration options
-        client1 = PropellerAdsClient(
-            api_key="test-key-1",
-            timeout=60,
-            max_retries=5,
-            rate_limit=120
-        )
-        
-        client2 = PropellerAdsClient(
-            api_key="test-key-2",
-            timeout=30,
-            max_retries=3,
-            rate_limit=60,
-            enable_metrics=False
-        )
+        client = client_cls(api_key="test-key", **config)
         
-        # Configurations should be different
-        assert client1.config.timeout == 60
-        assert client2.config.timeout == 30
-        assert client1.config.rate_limit == 120
-        assert client2.config.rate_limit == 60
+        for name, value in config.items():
+            assert getattr(client.config, name) == value
@@ -0,0 +1,77 @@
+"""
+Cache Utility Tests for PropellerAds SDK
+
+Tests for the in-memory TTL cache used for read-mostly API data.
+"""
+
+import pytest
+from unittest.mock import patch
+from propellerads.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTL cache behaviour."""
+
+    def test_get_and_set(self):
+        """Test storing and reading values."""
+        cache = TTLCache(ttl=30)
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+
+        cache.set("balance", {"amount": 100})
+
+        assert cache.get("balance") == {"amount": 100}
+        assert "balance" in cache
+        assert len(cache) == 1
+
+    def test_entry_expiry(self):
+        """Test entries expire after their TTL."""
+        cache = TTLCache(ttl=30)
+
+        with patch('propellerads.utils.cache.time.monotonic', return_value=1000.0):
+            cache.set("short", 1)
+            cache.set("long", 2, ttl=3600)
+
+        with patch('propellerads.utils.cache.time.monotonic', return_value=1031.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == 2
+            assert "short" not in cache
+
+    def test_maxsize_eviction(self):
+        """Test oldest entries are evicted when full."""
+        cache = TTLCache(ttl=30, maxsize=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_invalidate_and_clear(self):
+        """Test explicit invalidation."""
+        cache = TTLCache(ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_status(self):
+        """Test hit/miss statistics."""
+        cache = TTLCache(ttl=30)
+        cache.set("a", 1)
+
+        cache.get("a")
+        cache.get("b")
+
+        status = cache.get_status()
+        assert status['hits'] == 1
+        assert status['misses'] == 1
+        assert status['hit_rate'] == 0.5
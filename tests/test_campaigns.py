@@ -2,6 +2,9 @@ import pytest
 import vcr
 from propellerads.client import PropellerAdsClient
 
+# Keep cassette reads/writes on a single xdist worker
+pytestmark = pytest.mark.xdist_group("vcr_cassettes")
+
 @pytest.fixture
 def client():
     return PropellerAdsClient(api_key="test_api_key")
@@ -27,6 +27,9 @@ test_vcr = vcr.VCR(
     decode_compressed_response=True
 )
 
+# Keep cassette reads/writes on a single xdist worker
+pytestmark = pytest.mark.xdist_group("vcr_cassettes")
+
 
 class TestComprehensiveAPI:
     """Comprehensive API testing with VCR.py"""
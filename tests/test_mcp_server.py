@@ -0,0 +1,211 @@
+"""
+MCP Server Tests for PropellerAds SDK
+
+Tests for read caching, request coalescing, argument checks, result
+formatting and natural language commands in the MCP server.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import pytest
+from unittest.mock import Mock
+
+from propellerads.ai_interface import PropellerAdsAIInterface
+from propellerads import mcp_server
+from propellerads.mcp_server import PropellerAdsMCPServer, READ_CACHE_TTL, _check_dates, _format_result
+from propellerads.utils.cache import TTLCache
+
+
+class SingleCommandAIInterface:
+    """AI interface stub that only returns once three commands run at once"""
+
+    def __init__(self):
+        self.threads = set()
+        self.barrier = threading.Barrier(3, timeout=5)
+
+    def process_natural_language_command(self, command, confirm_write_operations=True):
+        self.threads.add(threading.get_ident())
+        # Only passes if all three commands run at the same time
+        self.barrier.wait()
+        return {"action": command}
+
+
+def make_server(ai_interface=None, client=None):
+    """Build a server without registering MCP handlers"""
+    server = PropellerAdsMCPServer.__new__(PropellerAdsMCPServer)
+    server._client = client
+    server._ai_interface = ai_interface
+    server._read_cache = TTLCache(ttl=READ_CACHE_TTL, maxsize=256)
+    server._inflight = {}
+    return server
+
+
+class TestReadCoalescing:
+    """Test concurrent identical reads share one upstream call."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_reads_share_one_call(self):
+        """Test identical reads in flight together run the handler once."""
+        server = make_server()
+        release = asyncio.Event()
+        calls = []
+
+        async def handler(**kwargs):
+            calls.append(kwargs)
+            await release.wait()
+            return {"campaigns": [], "limit": kwargs["limit"]}
+
+        first = asyncio.ensure_future(server._call_single_flight("list_campaigns", handler, {"limit": 10}))
+        second = asyncio.ensure_future(server._call_single_flight("list_campaigns", handler, {"limit": 10}))
+        other = asyncio.ensure_future(server._call_single_flight("list_campaigns", handler, {"limit": 20}))
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(first, second, other)
+
+        assert calls == [{"limit": 10}, {"limit": 20}]
+        assert results[0] is results[1]
+        assert results[2]["limit"] == 20
+        assert server._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_completed_read_is_not_reused_by_single_flight(self):
+        """Test a finished call is dropped so later reads call the handler again."""
+        server = make_server()
+        calls = []
+
+        async def handler(**kwargs):
+            calls.append(kwargs)
+            return {"ok": True}
+
+        await server._call_single_flight("health_check", handler, {})
+        await server._call_single_flight("health_check", handler, {})
+
+        assert len(calls) == 2
+
+
+class TestReadCache:
+    """Test cached read results and their invalidation by writes."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("write_handler", ["_handle_create_campaign", "_handle_update_campaign"])
+    async def test_writes_invalidate_cached_reads(self, write_handler):
+        """Test create/update handlers drop cached balance results."""
+        client = Mock()
+        client.balance.get_balance.return_value = 100
+        server = make_server(client=client)
+
+        await server._handle_get_balance()
+        await server._handle_get_balance()
+        assert client.balance.get_balance.call_count == 1
+
+        await getattr(server, write_handler)(campaign_id=1, name="Updated")
+        await server._handle_get_balance()
+
+        assert client.balance.get_balance.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test a failed read is retried on the next call."""
+        client = Mock()
+        client.balance.get_balance.side_effect = [RuntimeError("down"), 100]
+        server = make_server(client=client)
+
+        assert (await server._handle_get_balance())["error"] == "down"
+        assert (await server._handle_get_balance())["raw_amount"] == 100
+
+
+class TestResultFormatting:
+    """Test tool results are rendered as one JSON document."""
+
+    def test_large_list_stays_in_one_document(self):
+        """Test long campaign lists are not split out of the result."""
+        result = {"campaigns": [{"id": i} for i in range(250)], "count": 250}
+
+        assert json.loads(_format_result(result)) == result
+
+    def test_error_result(self):
+        """Test error results are rendered as an error message."""
+        assert _format_result({"error": "boom"}) == "❌ Error: boom"
+
+
+class TestDocumentationBundleCache:
+    """Test the documentation bundle persisted across restarts."""
+
+    def test_bundle_reused_and_replaced(self, tmp_path, monkeypatch):
+        """Test an unchanged bundle is read back and a rebuilt one replaces it."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("PROPELLERADS_MCP_CACHE_DIR", str(cache_dir))
+        doc_file = tmp_path / "guide.md"
+        doc_file.write_text("first")
+        server = make_server()
+
+        content = server._read_documentation_bundle([doc_file])
+        bundles = list(cache_dir.glob("docs-*.md"))
+        assert "first" in content
+        assert len(bundles) == 1
+
+        bundles[0].write_text("from cache")
+        assert server._read_documentation_bundle([doc_file]) == "from cache"
+
+        doc_file.write_text("second edition")
+        os.utime(doc_file, ns=(0, doc_file.stat().st_mtime_ns + 1_000_000_000))
+        content = server._read_documentation_bundle([doc_file])
+
+        assert "second edition" in content
+        assert [path.read_text() for path in cache_dir.glob("docs-*.md")] == [content]
+
+
+class TestDateArguments:
+    """Test date argument pre-validation."""
+
+    @pytest.mark.parametrize("arguments", [
+        None,
+        {},
+        {"campaign_id": 1},
+        {"date_from": "2024-01-01", "date_to": "2024-01-31"},
+    ])
+    def test_valid_dates_accepted(self, arguments):
+        """Test missing or YYYY-MM-DD dates pass."""
+        assert _check_dates(arguments) is None
+
+    @pytest.mark.parametrize("arguments, key", [
+        ({"date_from": "2024-1-01"}, "date_from"),
+        ({"date_from": "2024-01-01", "date_to": "01/31/2024"}, "date_to"),
+        ({"date_to": "2024-01-31 00:00:00"}, "date_to"),
+        ({"date_from": 20240101}, "date_from"),
+        ({"date_from": "2024-01-01\n"}, "date_from"),
+    ])
+    def test_invalid_dates_rejected(self, arguments, key):
+        """Test malformed dates are reported with the offending argument."""
+        error = _check_dates(arguments)
+        assert error is not None
+        assert error.startswith(f"Invalid {key}")
+
+
+class TestNaturalLanguageCommands:
+    """Test natural language command handling."""
+
+    def test_server_uses_packaged_ai_interface(self):
+        """Test the server picks up the packaged AI interface."""
+        assert mcp_server.PropellerAdsAIInterface is PropellerAdsAIInterface
+
+    @pytest.mark.asyncio
+    async def test_commands_run_concurrently(self):
+        """Test each command gets its own worker thread."""
+        ai_interface = SingleCommandAIInterface()
+        server = make_server(ai_interface)
+
+        try:
+            responses = await asyncio.gather(*(
+                server._handle_natural_language(f"command {index}") for index in range(3)
+            ))
+        finally:
+            server.close()
+
+        assert len(ai_interface.threads) == 3
+        assert [response["result"]["action"] for response in responses] == [
+            "command 0", "command 1", "command 2"
+        ]
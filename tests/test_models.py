@@ -0,0 +1,35 @@
+"""
+Model Tests for PropellerAds SDK
+
+Tests for the pydantic campaign models built from API responses.
+"""
+
+import pytest
+from propellerads.models.campaign import Campaign, TrafficSource
+
+
+class TestCampaignModel:
+    """Test campaign model parsing."""
+
+    def test_traffic_source_tolerates_api_payload(self):
+        """Test extra keys are ignored and string IDs are coerced."""
+        campaign = Campaign.from_api_response({
+            'id': 1,
+            'name': 'Test Campaign',
+            'status': 'active',
+            'traffic_source': {'id': '5', 'name': 'Push', 'type': 'push', 'region': 'EU'}
+        })
+
+        assert isinstance(campaign.traffic_source, TrafficSource)
+        assert campaign.traffic_source.id == 5
+        assert campaign.traffic_source.name == 'Push'
+
+    def test_traffic_source_rejects_invalid_id(self):
+        """Test a non-numeric traffic source ID fails validation."""
+        with pytest.raises(ValueError):
+            Campaign.from_api_response({
+                'id': 1,
+                'name': 'Test Campaign',
+                'status': 'active',
+                'traffic_source': {'id': 'push', 'name': 'Push', 'type': 'push'}
+            })
@@ -4,6 +4,8 @@ Comprehensive tests for the PropellerAds Python SDK.
 """
 
 import pytest
+import asyncio
+import json
 import os
 import time
 import requests
@@ -28,6 +30,78 @@ class TestPropellerAdsClient:
         assert self.client.config.base_url == "https://ssp-api.propellerads.com/v5"
         assert hasattr(self.client, 'session')
 
+    def test_session_built_on_first_use(self):
+        """Test the HTTP session is only created when first needed."""
+        client = PropellerAdsClient(api_key="test_api_key")
+
+        assert client._session is None
+        assert client.session is client.session
+        assert client.session.headers['Authorization'] == 'Bearer test_api_key'
+
+    def test_async_calls_across_event_loops(self):
+        """Test one client serves async calls from separate asyncio.run loops."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def balance(request):
+            return web.Response(text='1686.48')
+
+        async def fetch_balance():
+            app = web.Application()
+            app.router.add_get('/adv/balance', balance)
+            async with TestServer(app) as server:
+                self.client.config.base_url = str(server.make_url('')).rstrip('/')
+                result = await self.client.get_balance_async()
+                session = self.client._async_session
+            return result, session
+
+        first, first_session = asyncio.run(fetch_balance())
+        second, second_session = asyncio.run(fetch_balance())
+
+        assert first.amount == second.amount == Decimal('1686.48')
+        assert second_session is not first_session
+
+    @patch('requests.Session.request')
+    def test_request_body_with_int_keys(self, mock_request):
+        """Test request bodies keyed by integers are encoded like the stdlib json module."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_request.return_value = mock_response
+
+        self.client._make_request('PUT', '/adv/campaigns/1/zones', data={123: 1.5, 'rates': {456: 2}})
+
+        sent = mock_request.call_args.kwargs
+        body = sent['data'] if 'data' in sent else json.dumps(sent['json']).encode()
+        assert json.loads(body) == {'123': 1.5, 'rates': {'456': 2}}
+
+    def test_get_statistics_arrow_record_batches(self, monkeypatch):
+        """Test statistics rows are converted in record batches when a schema is given."""
+        pa = pytest.importorskip("pyarrow")
+        import propellerads.client as client_module
+
+        rows = [{'campaign_id': i, 'impressions': i * 10} for i in range(5)]
+        monkeypatch.setattr(client_module, 'ARROW_BATCH_SIZE', 2)
+        monkeypatch.setattr(self.client, 'iter_statistics', lambda *args: iter(rows))
+        schema = pa.schema([('campaign_id', pa.int64()), ('impressions', pa.int64())])
+
+        table = self.client.get_statistics_arrow("2025-09-01", "2025-09-30", schema=schema)
+
+        assert len(table.to_batches()) == 3
+        assert table.to_pylist() == rows
+        assert self.client.get_statistics_arrow("2025-09-01", "2025-09-30").to_pylist() == rows
+
+    @pytest.mark.parametrize("retry_after, expected", [("3600", 30.0), ("2", 2.0), (None, None)])
+    def test_sync_retry_after_capped(self, retry_after, expected):
+        """Test the adapter retry policy caps Retry-After at MAX_RETRY_DELAY."""
+        from urllib3.response import HTTPResponse
+
+        retry = self.client.session.get_adapter('https://').max_retries
+        headers = {'Retry-After': retry_after} if retry_after is not None else {}
+        response = HTTPResponse(status=429, headers=headers)
+
+        assert retry.get_retry_after(response) == expected
+        assert retry.new(total=1).get_retry_after(response) == expected
+
     @patch('requests.Session.request')
     def test_get_balance_success(self, mock_request):
         """Test successful balance retrieval."""
@@ -59,6 +133,96 @@ class TestPropellerAdsClient:
         assert len(result) == 1
         assert result[0]['id'] == 1
 
+    @patch('requests.Session.request')
+    def test_get_campaigns_cached_until_write(self, mock_request):
+        """Test campaign lists are cached and cleared by campaign writes."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'result': [{'id': 1, 'name': 'Test Campaign'}],
+            'total': 1
+        }
+        mock_request.return_value = mock_response
+
+        self.client.get_campaigns()
+        self.client.get_campaigns()
+        assert mock_request.call_count == 1
+
+        self.client.delete_campaign(1)
+        self.client.get_campaigns()
+        assert mock_request.call_count == 3
+
+    @patch('requests.Session.request')
+    def test_get_campaigns_cache_not_shared_with_callers(self, mock_request):
+        """Test editing a returned campaign does not change later cached results."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'result': [{'id': 1, 'name': 'Test Campaign'}],
+            'total': 1
+        }
+        mock_request.return_value = mock_response
+
+        self.client.get_campaigns()[0]['name'] = 'Edited'
+
+        assert self.client.get_campaigns()[0]['name'] == 'Test Campaign'
+        assert mock_request.call_count == 1
+
+    @patch('requests.Session.request')
+    def test_get_campaigns_by_name_index(self, mock_request):
+        """Test the name index is built from one campaign list fetch."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'result': [{'id': 1, 'name': 'First'}, {'id': 2, 'name': 'Second'}],
+            'total': 2
+        }
+        mock_request.return_value = mock_response
+
+        index = self.client.get_campaigns_by_name_index()
+
+        assert index['Second']['id'] == 2
+        assert self.client.get_campaigns_by_name_index().get('Missing') is None
+        assert mock_request.call_count == 1
+
+    @patch('requests.Session.request')
+    def test_get_campaigns_name_filter(self, mock_request):
+        """Test the name filter is sent to the API and matched exactly."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'result': [{'id': 1, 'name': 'Wanted'}, {'id': 2, 'name': 'Wanted (copy)'}],
+            'total': 2
+        }
+        mock_request.return_value = mock_response
+
+        result = self.client.get_campaigns(name='Wanted')
+
+        assert [campaign['id'] for campaign in result] == [1]
+        assert mock_request.call_args.kwargs['params']['name'] == 'Wanted'
+
+        self.client.get_campaigns(fields=('id', 'name'))
+        assert mock_request.call_args.kwargs['params']['fields'] == 'id,name'
+
+    @patch('requests.Session.request')
+    def test_iter_all_campaigns_is_lazy(self, mock_request):
+        """Test pages are only requested as the iterator is consumed."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'result': [{'id': 1}, {'id': 2}],
+            'meta': {'total_items': 6}
+        }
+        mock_request.return_value = mock_response
+
+        campaigns = self.client.iter_all_campaigns(page_size=2)
+
+        assert mock_request.call_count == 0
+        assert next(campaigns)['id'] == 1
+        assert mock_request.call_count == 1
+        assert len(list(campaigns)) == 5
+        assert mock_request.call_count == 3
+
     @patch('requests.Session.request')
     def test_health_check_success(self, mock_request):
         """Test successful health check."""
@@ -912,6 +1076,230 @@ class TestAsyncPropellerAdsClient:
             assert len(result['result']) == 1
             assert result['result'][0]['impressions'] == 1000
 
+    @pytest.mark.asyncio
+    @patch(
+        'propellerads.client.PropellerAdsClient.get_campaigns',
+        return_value=[{'id': 1, 'name': 'Test Campaign', 'status': 6}]
+    )
+    async def test_get_campaigns_typed(self, mock_get_campaigns):
+        """Test campaigns are returned as unvalidated Campaign objects."""
+        from propellerads.schemas.campaign import Campaign
+
+        async with AsyncPropellerAdsClient(api_key="test_api_key") as client:
+            result = await client.get_campaigns_typed()
+            assert len(result) == 1
+            assert isinstance(result[0], Campaign)
+            assert result[0].id == 1
+            assert result[0].status == 6
+
+    @pytest.mark.asyncio
+    @patch(
+        'propellerads.client.PropellerAdsClient.get_statistics',
+        return_value={'result': [{'campaign_id': 1, 'impressions': 1000, 'clicks': 100}]}
+    )
+    async def test_get_statistics_typed(self, mock_get_statistics):
+        """Test statistics rows are returned as StatisticsRow objects."""
+        from propellerads.schemas.statistics import StatisticsRow
+
+        async with AsyncPropellerAdsClient(api_key="test_api_key") as client:
+            result = await client.get_statistics_typed(date_from="2025-09-30 00:00:00", date_to="2025-09-30 23:59:59")
+            assert isinstance(result[0], StatisticsRow)
+            assert result[0].impressions == 1000
+            assert result[0].conversions == 0
+
+
+class TestAsyncHealthCheck:
+    """Tests for the concurrent async health check."""
+
+    HEALTH_CHECK_KEYS = {
+        'overall_status', 'timestamp', 'response_time', 'balance',
+        'rate_limiter', 'circuit_breaker', 'metrics'
+    }
+
+    @staticmethod
+    def fake_responses(balance='1686.48', failing=()):
+        """Build a _make_request_async replacement answering per endpoint."""
+        async def request(method, endpoint, data=None, params=None):
+            if endpoint in failing:
+                raise PropellerAdsError("Server error")
+            if endpoint == '/adv/balance':
+                return balance
+            return {'result': []}
+        return request
+
+    @pytest.mark.asyncio
+    async def test_healthy_keeps_sync_keys(self):
+        """Test a healthy result carries the keys of the sync health check."""
+        client = PropellerAdsClient(api_key="test_api_key")
+        client._make_request_async = self.fake_responses()
+
+        health = await client.health_check_async()
+
+        assert health['overall_status'] == 'healthy'
+        assert self.HEALTH_CHECK_KEYS <= health.keys()
+        assert health['balance'] == '$1,686.48'
+        assert set(health['checks'].values()) == {'ok'}
+
+    @pytest.mark.asyncio
+    async def test_failing_secondary_probe_is_degraded(self):
+        """Test a failing non-balance probe degrades the result."""
+        client = PropellerAdsClient(api_key="test_api_key")
+        client._make_request_async = self.fake_responses(failing=('/adv/campaigns',))
+
+        health = await client.health_check_async()
+
+        assert health['overall_status'] == 'degraded'
+        assert health['checks']['campaigns'] != 'ok'
+        assert health['balance'] == '$1,686.48'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("balance", ['not a number', {'amount': 10}])
+    async def test_unparseable_balance_is_unhealthy(self, balance):
+        """Test an unparseable balance body is reported, not raised."""
+        client = PropellerAdsClient(api_key="test_api_key")
+        client._make_request_async = self.fake_responses(balance=balance)
+
+        health = await client.health_check_async()
+
+        assert health['overall_status'] == 'unhealthy'
+        assert 'Invalid balance format' in health['error']
+        assert health['checks']['balance'] == health['error']
+
+
+class TestCampaignStateBatching:
+    """Tests for coalescing single-campaign start/stop calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_starts_share_one_request(self):
+        """Test concurrent start_campaign calls send one PUT with unique IDs."""
+        from propellerads.client_enhanced import EnhancedPropellerAdsClient
+
+        client = EnhancedPropellerAdsClient("test_api_key")
+        client.campaigns._put = AsyncMock(return_value={'result': 'ok'})
+        try:
+            results = await asyncio.gather(
+                client.campaigns.start_campaign(1),
+                client.campaigns.start_campaign(2),
+                client.campaigns.start_campaign(1)
+            )
+        finally:
+            await client.aclose()
+
+        client.campaigns._put.assert_awaited_once_with(
+            '/adv/campaigns/play', data={'campaign_ids': [1, 2]}
+        )
+        assert results == [{'result': 'ok'}] * 3
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self):
+        """Test a failed stop request raises in every waiting stop_campaign call."""
+        from propellerads.client_enhanced import EnhancedPropellerAdsClient
+        from propellerads.exceptions import PropellerAdsAPIError
+
+        client = EnhancedPropellerAdsClient("test_api_key")
+        client.campaigns._put = AsyncMock(side_effect=PropellerAdsAPIError("Server error: HTTP 500"))
+        try:
+            results = await asyncio.gather(
+                client.campaigns.stop_campaign(1),
+                client.campaigns.stop_campaign(2),
+                return_exceptions=True
+            )
+        finally:
+            await client.aclose()
+
+        client.campaigns._put.assert_awaited_once_with(
+            '/adv/campaigns/stop', data={'campaign_ids': [1, 2]}
+        )
+        assert all(isinstance(result, PropellerAdsAPIError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_batch_workers(self):
+        """Test closing the client cancels the start/stop batch workers."""
+        from propellerads.client_enhanced import EnhancedPropellerAdsClient
+
+        client = EnhancedPropellerAdsClient("test_api_key")
+        client.campaigns._put = AsyncMock(return_value={'result': 'ok'})
+        await client.campaigns.start_campaign(1)
+        await client.campaigns.stop_campaign(1)
+        workers = [client.campaigns._start_batcher._worker, client.campaigns._stop_batcher._worker]
+
+        await client.aclose()
+        await asyncio.sleep(0)
+
+        assert all(worker.cancelled() for worker in workers)
+        assert client.campaigns._start_batcher._worker is None
+        assert client.campaigns._stop_batcher._worker is None
+
+
+class TestBaseAPI:
+    """Tests for the shared aiohttp request path of the API modules."""
+
+    @pytest.mark.asyncio
+    async def test_request_body_with_int_keys(self):
+        """Test bodies keyed by integers are sent with string keys."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+        from propellerads.client_enhanced import EnhancedPropellerAdsClient
+
+        async def echo(request):
+            return web.json_response(await request.json())
+
+        app = web.Application()
+        app.router.add_put('/adv/campaigns/1/zones', echo)
+        async with TestServer(app) as server:
+            client = EnhancedPropellerAdsClient(
+                "test_api_key", base_url=str(server.make_url('')).rstrip('/')
+            )
+            try:
+                result = await client.campaigns._put('/adv/campaigns/1/zones', data={123: 1.5})
+            finally:
+                await client.aclose()
+
+        assert result == {'123': 1.5}
+
+
+class TestStatisticsAPI:
+    """Tests for the async statistics API."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [b'{"data": [', b'[]', b'{"data": "rows"}'])
+    async def test_unparseable_body_raises_api_error(self, body):
+        """Test malformed or unexpected statistics bodies raise PropellerAdsAPIError."""
+        from pydantic import ValidationError
+        from propellerads.client_enhanced import EnhancedPropellerAdsClient
+        from propellerads.exceptions import PropellerAdsAPIError
+        from propellerads.schemas.statistics import StatisticsFilters
+
+        client = EnhancedPropellerAdsClient("test_api_key")
+        client.statistics._request = AsyncMock(return_value=body)
+        filters = StatisticsFilters(date_from="2025-09-01", date_to="2025-09-30")
+        try:
+            with pytest.raises(PropellerAdsAPIError) as exc_info:
+                await client.statistics.get_statistics_async(filters)
+        finally:
+            await client.aclose()
+
+        assert isinstance(exc_info.value.__cause__, ValidationError)
+
+    @pytest.mark.asyncio
+    async def test_statistics_rows_parsed(self):
+        """Test a valid body is parsed into rows with a computed total."""
+        from propellerads.client_enhanced import EnhancedPropellerAdsClient
+        from propellerads.schemas.statistics import StatisticsFilters
+
+        client = EnhancedPropellerAdsClient("test_api_key")
+        client.statistics._request = AsyncMock(
+            return_value=b'{"data": [{"campaign_id": 1, "impressions": 1000, "clicks": 10}]}'
+        )
+        filters = StatisticsFilters(date_from="2025-09-01", date_to="2025-09-30")
+        try:
+            statistics = await client.statistics.get_statistics_async(filters)
+        finally:
+            await client.aclose()
+
+        assert statistics.total_rows == 1
+        assert statistics.data[0].impressions == 1000
+
 
 @pytest.mark.integration
 class TestRealAPI: